@@ -10,6 +10,7 @@ cualquier módulo usando: from config import ...
 """
 
 import os
+import re
 import logging
 from pathlib import Path
 from enum import Enum
@@ -368,6 +369,13 @@ RESTRICTED_PATHS = [
     "/root",
 ]
 
+# Formas precompiladas de las dos listas anteriores para los validadores,
+# que se llaman en cada pulsación de tecla
+_VM_NAME_RE = re.compile(f"[{re.escape(VALID_NAME_CHARS)}]+")
+# "/" solo restringe la raíz misma; el resto, la carpeta y todo su contenido
+_RESTRICTED_EXACT = frozenset(RESTRICTED_PATHS)
+_RESTRICTED_PREFIXES = tuple(p.rstrip("/") + "/" for p in RESTRICTED_PATHS if p != "/")
+
 # ==================== CONFIGURACIÓN DE SNAPSHOTS ====================
 
 # Snapshots
@@ -412,7 +420,7 @@ def is_valid_vm_name(name):
     """Valida nombre de VM"""
     if not name or len(name) > MAX_VM_NAME_LENGTH:
         return False
-    return all(c in VALID_NAME_CHARS for c in name)
+    return _VM_NAME_RE.fullmatch(name) is not None
 
 
 def is_valid_path(path):
@@ -424,7 +432,7 @@ def is_valid_path(path):
 def is_restricted_path(path):
     """Verifica si es una ruta restringida"""
     path = str(Path(path).absolute())
-    return any(path.startswith(restricted) for restricted in RESTRICTED_PATHS)
+    return path in _RESTRICTED_EXACT or path.startswith(_RESTRICTED_PREFIXES)
 
 
 # ==================== DETECCIÓN DEL SISTEMA ====================
@@ -0,0 +1,110 @@
+# ==================== qemu_adapters/process_scanner.py ====================
+
+"""
+Enumeración de procesos QEMU en ejecución
+
+En Linux se lee /proc directamente: un listado del directorio y una lectura
+de /proc/<pid>/cmdline por proceso, sin lanzar subprocesos. En el resto de
+plataformas (o si /proc no está disponible) se usa psutil.
+"""
+
+import os
+import sys
+from typing import Iterator, List, Tuple
+
+import psutil
+
+
+# Prefijo del ejecutable de los emuladores (qemu-system-x86_64, -aarch64, ...)
+QEMU_PROCESS_PREFIX = "qemu-system"
+
+_PROC_DIR = "/proc"
+_QEMU_PREFIX_BYTES = QEMU_PROCESS_PREFIX.encode()
+
+
+def iter_qemu_processes() -> Iterator[Tuple[int, str]]:
+    """
+    Genera (pid, cmdline) de cada proceso QEMU en ejecución
+
+    Es un generador: quien solo necesita saber si hay alguno puede detenerse
+    en el primer resultado sin recorrer el resto de procesos.
+    """
+    if sys.platform.startswith('linux') and os.path.isdir(_PROC_DIR):
+        return _iter_proc()
+    return _iter_psutil()
+
+
+def _iter_proc() -> Iterator[Tuple[int, str]]:
+    """Recorre /proc leyendo solo el cmdline de cada PID"""
+    with os.scandir(_PROC_DIR) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"{_PROC_DIR}/{entry.name}/cmdline", 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                # El proceso terminó o no es accesible
+                continue
+
+            # argv se separa con NUL; argv[0] puede ser una ruta completa
+            argv0 = raw.split(b'\0', 1)[0]
+            if not argv0.rpartition(b'/')[2].startswith(_QEMU_PREFIX_BYTES):
+                continue
+
+            cmdline = raw.rstrip(b'\0').replace(b'\0', b' ')
+            yield int(entry.name), cmdline.decode('utf-8', errors='replace')
+
+
+def _iter_psutil() -> Iterator[Tuple[int, str]]:
+    """Alternativa portable basada en psutil"""
+    for proc in psutil.process_iter(attrs=['pid', 'name', 'cmdline']):
+        if (proc.info['name'] or '').startswith(QEMU_PROCESS_PREFIX):
+            yield proc.info['pid'], ' '.join(proc.info['cmdline'] or [])
+
+
+def terminate_qemu_processes(pids=None, timeout: float = 3) -> Tuple[int, List[int]]:
+    """
+    Termina los procesos QEMU con SIGTERM y escala a SIGKILL si no salen
+
+    pids permite reutilizar una enumeración previa; si no se da, se recorre
+    la tabla de procesos. Como entre la enumeración y la llamada el PID pudo
+    reutilizarse, antes de enviar la señal se comprueba que el proceso sigue
+    siendo un QEMU. psutil.wait_procs espera a todos a la vez con un único
+    plazo.
+
+    Retorna:
+        tuple: (procesos terminados, PIDs QEMU que no se pudieron terminar,
+                p. ej. por pertenecer a otro usuario)
+    """
+    if pids is None:
+        pids = [pid for pid, _ in iter_qemu_processes()]
+
+    procs = []
+    failed = []
+    for pid in pids:
+        try:
+            proc = psutil.Process(pid)
+            if not proc.name().startswith(QEMU_PROCESS_PREFIX):
+                # El PID ya pertenece a otro programa
+                continue
+            proc.terminate()
+            procs.append(proc)
+        except psutil.NoSuchProcess:
+            continue
+        except psutil.Error:
+            failed.append(pid)
+
+    _, alive = psutil.wait_procs(procs, timeout=timeout)
+    unkillable = []
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.Error:
+            unkillable.append(proc.pid)
+    psutil.wait_procs(alive, timeout=1)
+
+    failed.extend(unkillable)
+    return len(procs) - len(unkillable), failed
@@ -4,8 +4,12 @@
 Implementación del adaptador QEMU Executor
 """
 
+import os
+import select
 import subprocess
-from typing import Tuple, Optional
+import threading
+import time
+from typing import Callable, Tuple, Optional
 from pathlib import Path
 
 from qemu_adapters.ports import QEMUExecutor
@@ -17,6 +21,13 @@ class QEMUExecutorImpl(QEMUExecutor):
     
     def __init__(self):
         self.running_processes = {}
+        # Protege running_processes frente a los hilos vigilantes
+        self._lock = threading.Lock()
+        
+        # Se llama con el nombre de la VM cuando su proceso termina por sí
+        # solo (no con stop_vm). Se invoca desde el hilo vigilante: la UI
+        # debe reenviarlo a su hilo (p. ej. emitiendo una señal Qt).
+        self.on_process_finished: Optional[Callable[[str], None]] = None
     
     def execute(self, command: str, timeout: int = 30) -> Tuple[int, str, str]:
         """Ejecuta comando en shell"""
@@ -41,8 +52,18 @@ class QEMUExecutorImpl(QEMUExecutor):
             builder = QEMUCommandBuilder()
             command = builder.build_command(vm)
             
-            process = subprocess.Popen(command, shell=True)
-            self.running_processes[vm.name] = process
+            # Sin shell: el Popen corresponde al propio proceso QEMU
+            process = subprocess.Popen(command)
+            with self._lock:
+                self.running_processes[vm.name] = process
+            
+            # Un hilo bloqueado en wait() por VM: sin sondeo periódico
+            watcher = threading.Thread(
+                target=self._watch_process,
+                args=(vm.name, process),
+                daemon=True
+            )
+            watcher.start()
             return True
         except Exception as e:
             print(f"Error iniciando VM: {e}")
@@ -50,13 +71,120 @@ class QEMUExecutorImpl(QEMUExecutor):
     
     def stop_vm(self, name: str) -> bool:
         """Detiene una máquina virtual"""
-        if name in self.running_processes:
+        # Retirarla antes de terminarla: así el vigilante no la notifica
+        with self._lock:
+            process = self.running_processes.pop(name, None)
+        if process is None:
+            return False
+        
+        try:
+            process.terminate()
+            process.wait(timeout=5)
+            return True
+        except Exception as e:
+            print(f"Error deteniendo VM: {e}")
+            # Sigue en ejecución: volver a registrarla si no se relanzó
+            if process.poll() is None:
+                with self._lock:
+                    self.running_processes.setdefault(name, process)
+            return False
+    
+    def stop_all(self, timeout: float = 5) -> None:
+        """
+        Detiene todas las VMs lanzadas por el ejecutor
+        
+        Envía SIGTERM a todas a la vez y espera su salida en conjunto con un
+        único plazo; las que no terminan a tiempo reciben SIGKILL.
+        """
+        # Vaciar antes de terminar: los vigilantes no notificarán estas salidas
+        with self._lock:
+            processes = list(self.running_processes.values())
+            self.running_processes.clear()
+        
+        for process in processes:
             try:
-                self.running_processes[name].terminate()
-                self.running_processes[name].wait(timeout=5)
-                del self.running_processes[name]
-                return True
+                process.terminate()
+            except OSError:
+                pass
+        
+        for process in _wait_processes(processes, timeout):
+            try:
+                process.kill()
+                process.wait(timeout=1)
             except Exception as e:
-                print(f"Error deteniendo VM: {e}")
-                return False
-        return False
\ No newline at end of file
+                print(f"Error forzando cierre de VM: {e}")
+    
+    def _watch_process(self, name: str, process: subprocess.Popen):
+        """Espera a que el proceso termine y notifica si no fue detenido con stop_vm"""
+        process.wait()
+        
+        # Si stop_vm ya la retiró (o se relanzó con el mismo nombre) no se notifica
+        with self._lock:
+            exited = self.running_processes.get(name) is process
+            if exited:
+                del self.running_processes[name]
+        
+        callback = self.on_process_finished
+        if exited and callback is not None:
+            callback(name)
+
+
+# ==================== ESPERA DE PROCESOS ====================
+
+def _wait_processes(processes, timeout: float):
+    """
+    Espera a que terminen los procesos, como máximo timeout segundos en total
+    
+    En Linux >= 5.3 usa pidfd_open + poll: una sola espera por eventos para
+    todos los PIDs. Si no está disponible, espera proceso por proceso con el
+    tiempo restante del plazo.
+    
+    Retorna:
+        list: Procesos que siguen vivos al vencer el plazo
+    """
+    pending = [p for p in processes if p.poll() is None]
+    deadline = time.monotonic() + timeout
+    
+    if pending and hasattr(os, 'pidfd_open'):
+        try:
+            _poll_pidfds(pending, deadline)
+        except OSError:
+            # Kernel sin pidfd: se sigue con la espera clásica
+            pass
+    
+    for process in pending:
+        remaining = deadline - time.monotonic()
+        try:
+            process.wait(timeout=max(remaining, 0))
+        except subprocess.TimeoutExpired:
+            pass
+    
+    return [p for p in pending if p.poll() is None]
+
+
+def _poll_pidfds(processes, deadline: float) -> None:
+    """Espera la salida de los procesos con un pidfd por proceso y poll()"""
+    poller = select.poll()
+    fds = {}
+    try:
+        for process in processes:
+            try:
+                fd = os.pidfd_open(process.pid)
+            except ProcessLookupError:
+                # Ya terminó y fue recogido
+                continue
+            fds[fd] = process
+            poller.register(fd, select.POLLIN)
+        
+        while fds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for fd, _ in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                os.close(fd)
+                # Recoger el proceso para que no quede zombie
+                fds.pop(fd).poll()
+    finally:
+        for fd in fds:
+            os.close(fd)
@@ -6,7 +6,9 @@ PROPÓSITO: Implementar la lógica de negocio independiente del framework
 """
 
 import sys
-from typing import List, Optional
+from dataclasses import astuple
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 
 # ==================== IMPORTS LOCALES ====================
 from qemu_domain.models import (
@@ -98,7 +100,7 @@ class VMUseCase:
         Argumentos:
             vm: Objeto VirtualMachine con cambios
         """
-        self.vm_repo.update(vm)
+        self.vm_repo.save(vm)
     
     def delete_vm(self, name: str) -> None:
         """
@@ -123,7 +125,7 @@ class VMUseCase:
         vm = self.vm_repo.find_by_name(name)
         if vm:
             vm.status = status
-            self.vm_repo.update(vm)
+            self.vm_repo.save(vm)
         return vm
 
 
@@ -218,28 +220,56 @@ class QEMUCommandBuilder:
     
     Esta clase encapsula la lógica de construcción de líneas de comando
     para ejecutar máquinas virtuales con QEMU.
+    
+    Los comandos se devuelven como lista de argumentos (argv) para lanzarse
+    sin shell: las rutas no necesitan comillas y el proceso creado es el
+    propio QEMU.
     """
     
     @staticmethod
-    def _quote_path(path: str) -> str:
+    def make_key(vm: VirtualMachine, video: Optional[VideoConfig] = None,
+                 audio: Optional[AudioConfig] = None,
+                 usb: Optional[USBConfig] = None) -> "VMConfigKey":
         """
-        Agrega comillas a la ruta según el sistema operativo
+        Captura la configuración que determina el comando en una clave inmutable
+        
+        Los atributos mutables de la VM y las configuraciones opcionales se
+        copian por valor, de modo que modificarlos después no afecta a la
+        caché.
         
         Argumentos:
-            path: Ruta del archivo
+            vm: Configuración de la máquina virtual
+            video: Configuración de video (opcional)
+            audio: Configuración de audio (opcional)
+            usb: Configuración USB (opcional)
         
         Retorna:
-            str: Ruta entre comillas dobles
-        """
-        return f'"{path}"'
+            VMConfigKey: Clave hashable para la caché de comandos
+        """
+        return VMConfigKey(
+            name=vm.name,
+            ram=vm.ram,
+            cpus=vm.cpus,
+            iso=vm.iso,
+            disk=vm.disk,
+            vga=getattr(vm, 'vga', 'qxl'),
+            boot_order=getattr(vm, 'boot_order', 'Disco duro (para arrancar SO)'),
+            video=astuple(video) if video else None,
+            audio=astuple(audio) if audio else None,
+            usb=astuple(usb) if usb else None,
+            accel_flag=get_config().get_acceleration_flag(),
+        )
     
     @staticmethod
     def build_command(vm: VirtualMachine, video: Optional[VideoConfig] = None,
                      audio: Optional[AudioConfig] = None, 
-                     usb: Optional[USBConfig] = None) -> str:
+                     usb: Optional[USBConfig] = None) -> List[str]:
         """
         Construye comando QEMU completo
         
+        El resultado se cachea por valor de configuración (ver make_key), así
+        que no hace falta invalidarlo al modificar una VM.
+        
         Argumentos:
             vm: Configuración de la máquina virtual
             video: Configuración de video (opcional)
@@ -247,80 +277,19 @@ class QEMUCommandBuilder:
             usb: Configuración USB (opcional)
         
         Retorna:
-            str: Comando QEMU listo para ejecutar
+            List[str]: argv de QEMU listo para ejecutar
         """
-        config = get_config()
-
-        cmd = "qemu-system-x86_64"
-        
-        # Nombre de la VM
-        cmd += f" -name {vm.name}"
-        
-        # Memoria
-        cmd += f" -m {vm.ram}"
-        
-        # CPU
-        cmd += f" -smp cores={vm.cpus}"
-        
-        # ISO (si existe)
-        if vm.iso:
-            iso_quoted = QEMUCommandBuilder._quote_path(vm.iso)
-            cmd += f" -cdrom {iso_quoted}"
-        
-        # Disco duro
-        if vm.disk:
-            disk_quoted = QEMUCommandBuilder._quote_path(vm.disk)
-            cmd += f" -hda {disk_quoted}"
-        
-        # Orden de boot - Usar configuración de la VM
-        boot_order = getattr(vm, 'boot_order', 'Disco duro (para arrancar SO)')
-        if "Disco duro" in boot_order:
-            cmd += " -boot order=cd,menu=on"
-        else:
-            cmd += " -boot order=dc,menu=on"
-        
-        # USB para entrada
-        cmd += " -usb"
-        cmd += " -device usb-kbd"
-        cmd += " -device usb-mouse"
-        
-        # VGA - Usar configuración de la VM
-        vga = getattr(vm, 'vga', 'qxl')
-        cmd += f" -vga {vga}"
-        
-        # Video (si se especifica)
-        if video:
-            if video.gl_acceleration:
-                cmd += " -enable-kvm"
-            
-            if video.virgl:
-                cmd += " -device virtio-gpu-gl"
-        
-        # Audio (si está habilitado)
-        if audio and audio.enabled:
-            cmd += f" -audiodev {audio.driver},id=audio0"
-            cmd += f" -device {audio.model},audiodev=audio0"
-        
-        # Red
-        cmd += " -net nic,model=virtio"
-        cmd += " -net user"
-        
-        # USB (si se especifica)
-        if usb:
-            cmd += f" -device usb-ehci,id=ehci"
-            for i in range(usb.ports):
-                cmd += f" -device usb-port,bus=ehci.0,nr={i+1}"
-        
-        # Aceleración
-        cmd += config.get_acceleration_flag()
-
-        # Ejecutar en background
-        cmd += " &"
-        
-        return cmd
+        key = QEMUCommandBuilder.make_key(vm, video, audio, usb)
+        # Copia: la tupla cacheada no debe quedar expuesta a mutaciones
+        return list(_build_command_cached(key))
     
     @staticmethod
-    def build_minimal_command(vm: VirtualMachine) -> str:
+    def cache_clear() -> None:
+        """Vacía la caché de comandos construidos"""
+        _build_command_cached.cache_clear()
+    
+    @staticmethod
+    def build_minimal_command(vm: VirtualMachine) -> List[str]:
         """
         Construye comando QEMU minimal
         
@@ -330,33 +299,29 @@ class QEMUCommandBuilder:
             vm: Configuración de la máquina virtual
         
         Retorna:
-            str: Comando QEMU minimal
+            List[str]: argv de QEMU minimal
         """
-        cmd = "qemu-system-x86_64"
-        cmd += f" -name {vm.name}"
-        cmd += f" -m {vm.ram}"
-        cmd += f" -smp cores={vm.cpus}"
+        cmd = ["qemu-system-x86_64"]
+        cmd += ["-name", vm.name]
+        cmd += ["-m", str(vm.ram)]
+        cmd += ["-smp", f"cores={vm.cpus}"]
         
         if vm.iso:
-            iso_quoted = QEMUCommandBuilder._quote_path(vm.iso)
-            cmd += f" -cdrom {iso_quoted}"
+            cmd += ["-cdrom", vm.iso]
         
         if vm.disk:
-            disk_quoted = QEMUCommandBuilder._quote_path(vm.disk)
-            cmd += f" -hda {disk_quoted}"
+            cmd += ["-hda", vm.disk]
         
         boot_order = getattr(vm, 'boot_order', 'Disco duro (para arrancar SO)')
         if "Disco duro" in boot_order:
-            cmd += " -boot order=cd,menu=on"
+            cmd += ["-boot", "order=cd,menu=on"]
         else:
-            cmd += " -boot order=dc,menu=on"
-        
-        cmd += " &"
+            cmd += ["-boot", "order=dc,menu=on"]
         
         return cmd
     
     @staticmethod
-    def build_kvm_command(vm: VirtualMachine) -> str:
+    def build_kvm_command(vm: VirtualMachine) -> List[str]:
         """
         Construye comando QEMU con aceleración KVM
         
@@ -366,30 +331,113 @@ class QEMUCommandBuilder:
             vm: Configuración de la máquina virtual
         
         Retorna:
-            str: Comando QEMU con KVM habilitado
+            List[str]: argv de QEMU con KVM habilitado
         """
-        cmd = "qemu-system-x86_64"
-        cmd += f" -name {vm.name}"
-        cmd += f" -m {vm.ram}"
-        cmd += f" -smp cores={vm.cpus}"
+        cmd = ["qemu-system-x86_64"]
+        cmd += ["-name", vm.name]
+        cmd += ["-m", str(vm.ram)]
+        cmd += ["-smp", f"cores={vm.cpus}"]
         
-        cmd += " -enable-kvm"
-        cmd += " -cpu host"
+        cmd.append("-enable-kvm")
+        cmd += ["-cpu", "host"]
         
         if vm.iso:
-            iso_quoted = QEMUCommandBuilder._quote_path(vm.iso)
-            cmd += f" -cdrom {iso_quoted}"
+            cmd += ["-cdrom", vm.iso]
         
         if vm.disk:
-            disk_quoted = QEMUCommandBuilder._quote_path(vm.disk)
-            cmd += f" -hda {disk_quoted}"
+            cmd += ["-hda", vm.disk]
         
         boot_order = getattr(vm, 'boot_order', 'Disco duro (para arrancar SO)')
         if "Disco duro" in boot_order:
-            cmd += " -boot order=cd,menu=on"
+            cmd += ["-boot", "order=cd,menu=on"]
         else:
-            cmd += " -boot order=dc,menu=on"
-        
-        cmd += " &"
+            cmd += ["-boot", "order=dc,menu=on"]
         
-        return cmd
\ No newline at end of file
+        return cmd
+
+
+# ==================== CACHÉ DE COMANDOS ====================
+
+class VMConfigKey(NamedTuple):
+    """Clave inmutable con todo lo que influye en el comando QEMU de una VM"""
+    name: str
+    ram: int
+    cpus: int
+    iso: Optional[str]
+    disk: str
+    vga: str
+    boot_order: str
+    video: Optional[tuple]
+    audio: Optional[tuple]
+    usb: Optional[tuple]
+    accel_flag: str
+
+
+@lru_cache(maxsize=128)
+def _build_command_cached(key: VMConfigKey) -> Tuple[str, ...]:
+    """Construye el argv QEMU completo a partir de una VMConfigKey"""
+    cmd = ["qemu-system-x86_64"]
+
+    # Nombre de la VM
+    cmd += ["-name", key.name]
+
+    # Memoria
+    cmd += ["-m", str(key.ram)]
+
+    # CPU
+    cmd += ["-smp", f"cores={key.cpus}"]
+
+    # ISO (si existe)
+    if key.iso:
+        cmd += ["-cdrom", key.iso]
+
+    # Disco duro
+    if key.disk:
+        cmd += ["-hda", key.disk]
+
+    # Orden de boot - Usar configuración de la VM
+    boot_order = key.boot_order
+    if "Disco duro" in boot_order:
+        cmd += ["-boot", "order=cd,menu=on"]
+    else:
+        cmd += ["-boot", "order=dc,menu=on"]
+
+    # USB para entrada
+    cmd.append("-usb")
+    cmd += ["-device", "usb-kbd"]
+    cmd += ["-device", "usb-mouse"]
+
+    # VGA - Usar configuración de la VM
+    vga = key.vga
+    cmd += ["-vga", vga]
+
+    # Video (si se especifica)
+    video = VideoConfig(*key.video) if key.video else None
+    if video:
+        if video.gl_acceleration:
+            cmd.append("-enable-kvm")
+
+        if video.virgl:
+            cmd += ["-device", "virtio-gpu-gl"]
+
+    # Audio (si está habilitado)
+    audio = AudioConfig(*key.audio) if key.audio else None
+    if audio and audio.enabled:
+        cmd += ["-audiodev", f"{audio.driver},id=audio0"]
+        cmd += ["-device", f"{audio.model},audiodev=audio0"]
+
+    # Red
+    cmd += ["-net", "nic,model=virtio"]
+    cmd += ["-net", "user"]
+
+    # USB (si se especifica)
+    usb = USBConfig(*key.usb) if key.usb else None
+    if usb:
+        cmd += ["-device", "usb-ehci,id=ehci"]
+        for i in range(usb.ports):
+            cmd += ["-device", f"usb-port,bus=ehci.0,nr={i+1}"]
+
+    # Aceleración
+    cmd += key.accel_flag.split()
+
+    return tuple(cmd)
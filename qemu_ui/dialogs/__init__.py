@@ -1,21 +1,31 @@
 """
 Paquete de diálogos para QEMU Manager
+
+Los diálogos se importan bajo demanda (PEP 562): solo se carga el módulo
+del diálogo que realmente se abre.
 """
 
-from .disk_manager_dialog import DiskManagerDialog
-from .network_dialog import NetworkDialog
-from .video_dialog import VideoDialog
-from .peripherals_dialog import PeripheralsDialog
-from .search_dialog import SearchDialog
-from .about_dialog import AboutDialog
-from .settings_dialog import SettingsDialog
-
-__all__ = [
-    'DiskManagerDialog',
-    'NetworkDialog',
-    'VideoDialog',
-    'PeripheralsDialog',
-    'SearchDialog',
-    'AboutDialog',
-    'SettingsDialog',
-]
\ No newline at end of file
+import importlib
+
+_DIALOG_MODULES = {
+    'DiskManagerDialog': 'disk_manager_dialog',
+    'NetworkDialog': 'network_dialog',
+    'VideoDialog': 'video_dialog',
+    'PeripheralsDialog': 'peripherals_dialog',
+    'SearchDialog': 'search_dialog',
+    'AboutDialog': 'about_dialog',
+    'SettingsDialog': 'settings_dialog',
+}
+
+__all__ = list(_DIALOG_MODULES)
+
+
+def __getattr__(name):
+    if name in _DIALOG_MODULES:
+        module = importlib.import_module(f'.{_DIALOG_MODULES[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -6,12 +6,41 @@ Diálogo para gestionar discos virtuales - CON LOADING OVERLAY
 from qemu_ui.widgets import LoadingOverlay
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QLineEdit, QSpinBox, QComboBox, QTableWidget, QTableWidgetItem,
-    QFileDialog, QMessageBox, QCheckBox, QFormLayout, QProgressBar, QWidget
+    QLineEdit, QSpinBox, QComboBox, QTableView, QTabWidget,
+    QFileDialog, QMessageBox, QCheckBox, QFormLayout, QProgressBar, QWidget,
+    QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
+)
+from PyQt5.QtCore import (
+    Qt, QThread, QEvent, QAbstractTableModel, QModelIndex, pyqtSignal
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from pathlib import Path
 import os
+import time
+
+
+_HOME = Path.home()
+
+# Ubicación por defecto de discos nuevos y rutas donde se buscan discos
+_DEFAULT_DISK_DIR = str(_HOME / "VirtualMachines")
+_SEARCH_PATHS = (
+    _DEFAULT_DISK_DIR,
+    str(_HOME / "QEMU"),
+    str(_HOME / "Documentos"),
+)
+
+# Opciones de los combos de creación y conversión
+_FORMAT_ITEMS = ("qcow2", "raw", "vdi", "vmdk")
+_PRESET_ITEMS = ("Personalizado", "Linux (20GB)", "Windows (50GB)", "Servidor (100GB)")
+
+# Extensiones de imágenes de disco reconocidas
+_DISK_SUFFIXES = frozenset({'.qcow2', '.img', '.vdi', '.vmdk'})
+
+# Directorios que nunca contienen discos de VM (los ocultos, como .git o
+# .cache, ya se descartan por empezar con punto)
+_SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'snap'})
+
+# Intervalo mínimo entre avisos de progreso (segundos)
+_PROGRESS_INTERVAL = 0.15
 
 
 class DiskSearchWorker(QThread):
@@ -22,41 +51,166 @@ class DiskSearchWorker(QThread):
     
     def __init__(self, search_paths):
         super().__init__()
-        self.search_paths = search_paths
+        # Resolver enlaces y descartar rutas repetidas
+        self.search_paths = list(dict.fromkeys(
+            os.path.realpath(p) for p in search_paths
+        ))
         self.disks = []
+        self._visited = set()
+        self._cancel = False
+        self._last_emit = 0.0
+    
+    def cancel(self):
+        """Pide al worker que termine cuanto antes (no bloquea)"""
+        self._cancel = True
     
     def run(self):
         """Busca discos en background"""
+        self._visited.clear()
         for path_str in self.search_paths:
+            if self._cancel:
+                break
             if not os.path.exists(path_str):
                 continue
             
             try:
-                path_obj = Path(path_str)
-                
                 # Limitar profundidad de búsqueda a 3 niveles
-                for disk_path in self._walk_limited(path_obj, max_depth=3):
-                    if disk_path.suffix in ['.qcow2', '.img', '.vdi', '.vmdk']:
-                        self.disks.append(disk_path)
-                        self.progress.emit(f"Encontrado: {disk_path.name}")
+                for disk in self._walk_limited(path_str, max_depth=3):
+                    self.disks.append(disk)
+                    
+                    # Avisar como mucho cada _PROGRESS_INTERVAL con el último hallazgo
+                    now = time.monotonic()
+                    if now - self._last_emit > _PROGRESS_INTERVAL:
+                        self.progress.emit(disk[0])
+                        self._last_emit = now
             except Exception as e:
                 print(f"Error buscando en {path_str}: {e}")
         
         self.finished.emit(self.disks)
     
-    def _walk_limited(self, path, max_depth=3, current_depth=0):
-        """Recorre directorios limitando profundidad"""
-        if current_depth >= max_depth:
-            return
-        
-        try:
-            for item in path.iterdir():
-                if item.is_file():
-                    yield item
-                elif item.is_dir() and not item.name.startswith('.'):
-                    yield from self._walk_limited(item, max_depth, current_depth + 1)
-        except (PermissionError, OSError):
-            pass
+    def _walk_limited(self, path, max_depth=3):
+        """
+        Recorre directorios limitando profundidad y devuelve las imágenes de disco
+        
+        Cada disco se entrega como una tupla de textos listos para la tabla:
+        (nombre, tamaño, ubicación, formato, ruta completa).
+        
+        Recorrido iterativo con os.scandir: el tipo de cada entrada sale del
+        propio listado del directorio, sin stat() adicional por archivo. Los
+        directorios enlazados no se siguen; los archivos enlazados sí. El
+        tamaño y los textos se calculan aquí para no hacerlo en el hilo de la UI.
+        
+        Cada directorio se visita una sola vez (por dispositivo e inodo),
+        aunque aparezca bajo varias raíces de búsqueda o por montajes bind.
+        """
+        stack = [(str(path), 0)]
+        while stack and not self._cancel:
+            dir_path, depth = stack.pop()
+            try:
+                st = os.stat(dir_path)
+                key = (st.st_dev, st.st_ino)
+                if key in self._visited:
+                    continue
+                self._visited.add(key)
+                
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if self._cancel:
+                            return
+                        name = entry.name
+                        if name.startswith('.'):
+                            continue
+                        try:
+                            if entry.is_file():
+                                dot = name.rfind('.')
+                                if dot >= 0 and name[dot:] in _DISK_SUFFIXES:
+                                    try:
+                                        size = entry.stat().st_size
+                                    except OSError:
+                                        size = 0
+                                    yield (
+                                        name[:dot],
+                                        f"{size / (1024**3):.2f} GB",
+                                        dir_path,
+                                        name[dot + 1:].upper(),
+                                        entry.path,
+                                    )
+                            elif (depth + 1 < max_depth and name not in _SKIP_DIRS
+                                  and entry.is_dir(follow_symlinks=False)):
+                                stack.append((entry.path, depth + 1))
+                        except OSError:
+                            continue
+            except (PermissionError, OSError):
+                pass
+
+
+class DisksModel(QAbstractTableModel):
+    """
+    Modelo de la tabla de discos
+    
+    Sirve directamente las tuplas (nombre, tamaño, ubicación, formato, ruta)
+    que entrega DiskSearchWorker; la columna "Acciones" la dibuja
+    DeleteDelegate.
+    """
+    
+    HEADERS = ("Nombre", "Tamano", "Ubicacion", "Formato", "Acciones")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._disks = []
+    
+    def set_disks(self, disks):
+        """Sustituye todos los discos del modelo"""
+        self.beginResetModel()
+        self._disks = disks
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._disks)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid() and index.column() < 4:
+            return self._disks[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class DeleteDelegate(QStyledItemDelegate):
+    """
+    Dibuja un botón [DELETE] en cada celda de la columna y avisa al pulsarlo
+    
+    Un único delegado para toda la columna en lugar de un QPushButton por
+    fila.
+    """
+    
+    delete_requested = pyqtSignal(int)
+    
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = "[DELETE]"
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+    
+    def createEditor(self, parent, option, index):
+        # La celda no es editable
+        return None
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and option.rect.contains(event.pos())):
+            self.delete_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class DiskManagerDialog(QDialog):
@@ -66,8 +220,10 @@ class DiskManagerDialog(QDialog):
         super().__init__(parent)
         self.storage = storage_adapter
         self.search_worker = None
+        self._rescan_pending = False
         self.loading_overlay = None
         self.disks_found = []
+        self._initial_scan_done = False
         self.init_ui()
     
     def init_ui(self):
@@ -76,18 +232,20 @@ class DiskManagerDialog(QDialog):
         
         layout = QVBoxLayout()
         
-        from PyQt5.QtWidgets import QTabWidget
         self.tabs = QTabWidget()
         
         create_tab = self.create_disk_tab()
         self.tabs.addTab(create_tab, "Crear Disco")
         
         manage_tab = self.manage_disks_tab()
-        self.tabs.addTab(manage_tab, "Gestionar Discos")
+        self._manage_tab_index = self.tabs.addTab(manage_tab, "Gestionar Discos")
         
         convert_tab = self.convert_disk_tab()
         self.tabs.addTab(convert_tab, "Convertir Formato")
         
+        # La primera búsqueda de discos se hace al abrir "Gestionar Discos"
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        
         layout.addWidget(self.tabs)
         
         close_btn = QPushButton("Cerrar")
@@ -105,7 +263,7 @@ class DiskManagerDialog(QDialog):
         layout.addRow("Nombre del Disco:", self.disk_name)
         
         self.disk_location = QLineEdit()
-        self.disk_location.setText(str(Path.home() / "VirtualMachines"))
+        self.disk_location.setText(_DEFAULT_DISK_DIR)
         btn_browse = QPushButton("Examinar...")
         btn_browse.clicked.connect(self.browse_disk_location)
         loc_layout = QHBoxLayout()
@@ -122,11 +280,12 @@ class DiskManagerDialog(QDialog):
         layout.addRow("Tamano:", size_layout)
         
         self.disk_format = QComboBox()
-        self.disk_format.addItems(["qcow2", "raw", "vdi", "vmdk"])
+        self.disk_format.addItems(_FORMAT_ITEMS)
         layout.addRow("Formato:", self.disk_format)
         
         self.disk_preset = QComboBox()
-        self.disk_preset.addItems(["Personalizado", "Linux (20GB)", "Windows (50GB)", "Servidor (100GB)"])
+        self.disk_preset.addItems(_PRESET_ITEMS)
+        # Conectar después de llenar el combo para no disparar on_preset_changed
         self.disk_preset.currentTextChanged.connect(self.on_preset_changed)
         layout.addRow("Preconfiguracion:", self.disk_preset)
         
@@ -147,11 +306,14 @@ class DiskManagerDialog(QDialog):
         layout = QVBoxLayout()
         
         # Tabla de discos
-        self.disks_table = QTableWidget()
-        self.disks_table.setColumnCount(5)
-        self.disks_table.setHorizontalHeaderLabels(["Nombre", "Tamano", "Ubicacion", "Formato", "Acciones"])
-        self.disks_table.setColumnWidth(2, 300)
-        layout.addWidget(self.disks_table)
+        self.disks_model = DisksModel(self)
+        self.disks_view = QTableView()
+        self.disks_view.setModel(self.disks_model)
+        self.disks_view.setColumnWidth(2, 300)
+        self._delete_delegate = DeleteDelegate(self.disks_view)
+        self._delete_delegate.delete_requested.connect(self.on_delete_requested)
+        self.disks_view.setItemDelegateForColumn(4, self._delete_delegate)
+        layout.addWidget(self.disks_view)
         
         # Botón actualizar
         btn_refresh = QPushButton("[REFRESH] Actualizar Lista")
@@ -164,11 +326,28 @@ class DiskManagerDialog(QDialog):
         self.loading_overlay = LoadingOverlay(widget)
         self.loading_overlay.hide()
         
-        # Iniciar búsqueda en background
-        self.refresh_disks()
-        
         return widget
     
+    def showEvent(self, event):
+        """
+        Cada apertura vuelve a buscar discos al mostrar la pestaña de gestión
+        
+        El diálogo se reutiliza entre aperturas: si se reabre con esa pestaña
+        ya seleccionada no hay currentChanged, así que se lanza aquí.
+        """
+        super().showEvent(event)
+        if event.spontaneous():
+            # Restaurar desde minimizado no es una nueva apertura
+            return
+        self._initial_scan_done = False
+        self._on_tab_changed(self.tabs.currentIndex())
+    
+    def _on_tab_changed(self, index):
+        """Lanza la búsqueda inicial la primera vez que se muestra la pestaña de gestión"""
+        if index == self._manage_tab_index and not self._initial_scan_done:
+            self._initial_scan_done = True
+            self.refresh_disks()
+    
     def convert_disk_tab(self):
         """Pestaña para convertir formato de disco"""
         widget = QWidget()
@@ -183,7 +362,7 @@ class DiskManagerDialog(QDialog):
         layout.addRow("Disco de Origen:", source_layout)
         
         self.conv_format = QComboBox()
-        self.conv_format.addItems(["qcow2", "raw", "vdi", "vmdk"])
+        self.conv_format.addItems(_FORMAT_ITEMS)
         layout.addRow("Formato Destino:", self.conv_format)
         
         self.conv_dest = QLineEdit()
@@ -270,65 +449,62 @@ class DiskManagerDialog(QDialog):
                 "Buscando archivos QCOW2, IMG, VDI y VMDK"
             )
         
-        # Detener búsqueda anterior si está en curso
+        # Si hay una búsqueda en curso, cancelarla sin bloquear la UI; la
+        # nueva arranca cuando la anterior entregue su resultado. Varios
+        # clics seguidos se agrupan en una sola búsqueda pendiente.
         if self.search_worker and self.search_worker.isRunning():
-            self.search_worker.wait()
+            self._rescan_pending = True
+            self.search_worker.cancel()
+            return
+        
+        self._start_scan()
+    
+    def _start_scan(self):
+        """Lanza un DiskSearchWorker nuevo"""
+        self._rescan_pending = False
         
-        # Definir rutas de búsqueda limitadas
-        search_paths = [
-            str(Path.home() / "VirtualMachines"),
-            str(Path.home() / "QEMU"),
-            str(Path.home() / "Documentos"),
-        ]
+        # El worker anterior ya emitió su resultado: solo queda el final de run()
+        if self.search_worker:
+            self.search_worker.wait()
         
         # Crear worker para búsqueda en background
-        self.search_worker = DiskSearchWorker(search_paths)
+        self.search_worker = DiskSearchWorker(_SEARCH_PATHS)
         self.search_worker.progress.connect(self.update_loading_progress)
         self.search_worker.finished.connect(self.on_disks_found)
         self.search_worker.start()
     
-    def update_loading_progress(self, message):
-        """Actualiza etiqueta de estado del loading"""
+    def update_loading_progress(self, disk_name):
+        """Actualiza etiqueta de estado del loading con el último disco encontrado"""
         if self.loading_overlay:
             self.loading_overlay.update_message(
                 "Escaneando discos...",
-                message
+                f"Encontrado: {disk_name}"
             )
     
     def on_disks_found(self, disks):
         """Cuando se completó la búsqueda de discos"""
+        if self._rescan_pending:
+            # Resultado de una búsqueda cancelada: lanzar la pendiente
+            self._start_scan()
+            return
+        
         # Ocultar loading overlay
         if self.loading_overlay:
             self.loading_overlay.stop()
             self.loading_overlay.hide()
         
-        # Guardar discos encontrados
-        self.disks_found = disks
-        
-        # Llenar tabla
-        self.disks_table.setRowCount(0)
+        # Si el resultado coincide con lo que ya se muestra, no tocar la tabla
+        if disks == self.disks_found:
+            return
         
-        for disk_path in disks:
-            self.add_disk_row(disk_path)
+        # Guardar discos encontrados y refrescar la vista con un único reset
+        self.disks_found = disks
+        self.disks_model.set_disks(disks)
     
-    def add_disk_row(self, disk_path):
-        """Agrega fila de disco a tabla"""
-        row = self.disks_table.rowCount()
-        self.disks_table.insertRow(row)
-        
-        name = disk_path.stem
-        size_gb = disk_path.stat().st_size / (1024**3)
-        location = str(disk_path.parent)
-        format_type = disk_path.suffix[1:]
-        
-        self.disks_table.setItem(row, 0, QTableWidgetItem(name))
-        self.disks_table.setItem(row, 1, QTableWidgetItem(f"{size_gb:.2f} GB"))
-        self.disks_table.setItem(row, 2, QTableWidgetItem(location))
-        self.disks_table.setItem(row, 3, QTableWidgetItem(format_type.upper()))
-        
-        btn_delete = QPushButton("[DELETE]")
-        btn_delete.clicked.connect(lambda: self.delete_disk(str(disk_path)))
-        self.disks_table.setCellWidget(row, 4, btn_delete)
+    def on_delete_requested(self, row):
+        """Botón [DELETE] pulsado en la fila indicada"""
+        if 0 <= row < len(self.disks_found):
+            self.delete_disk(self.disks_found[row][4])
     
     def delete_disk(self, disk_path):
         """Elimina disco"""
@@ -4,15 +4,68 @@ Diálogo para gestionar redes
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QLineEdit, QComboBox, QCheckBox, QFormLayout, QTextEdit, QTabWidget, QWidget,
+    QLineEdit, QComboBox, QCheckBox, QFormLayout, QTextEdit, QWidget,
     QSpinBox, QMessageBox
 )
+from PyQt5.QtCore import QTimer
+from qemu_ui.widgets import LazyTabWidget
+
+
+# Espera antes de redibujar el panel de información tras un cambio (ms)
+_INFO_DEBOUNCE_MS = 50
+
+# Descripción de cada tipo de red para el panel de información
+_NET_DESCRIPTIONS = {
+    "user": "✓ Sin configuración de red del host<br>✓ NAT automático<br>✓ Fácil de usar",
+    "bridge": "✓ VM en la misma red que el host<br>✓ Requiere configuración bridge<br>✓ Mayor control",
+    "tap": "✓ Interfaz tap en el host<br>✓ Mayor flexibilidad<br>✓ Requiere permisos root",
+    "vde": "✓ Virtual Distributed Ethernet<br>✓ Para entornos complejos<br>✓ Requiere VDE instalado"
+}
+
+
+# ==================== CAMPOS DE LAS PESTAÑAS ====================
+# (atributo, clase, opciones, etiqueta); ver NetworkDialog._build_fields
+
+_CREATE_SPEC = (
+    ("net_name", QLineEdit, {}, "Nombre de la Red:"),
+    ("net_type", QComboBox, {
+        "items": ("user", "bridge", "tap", "vde"),
+        "on_text": "_queue_network_info",
+    }, "Tipo de Red:"),
+    ("net_subnet", QLineEdit, {"text": "192.168.122.0/24"}, "Subred (CIDR):"),
+    ("net_dhcp", QCheckBox, {"caption": "Habilitar DHCP", "checked": True}, "DHCP:"),
+    ("net_ipv6", QCheckBox, {"caption": "Habilitar IPv6"}, "IPv6:"),
+    ("net_info", QTextEdit, {"read_only": True, "max_height": 150}, "Información:"),
+)
+
+# El rango va antes del valor: QSpinBox recorta el valor al rango vigente
+_CONFIG_SPEC = (
+    ("net_mtu", QSpinBox, {"range": (68, 65535), "value": 1500}, "MTU (bytes):"),
+    ("net_vlan", QSpinBox, {"range": (0, 4094), "value": 0}, "VLAN ID:"),
+)
+
+# Modelos de interfaz: (atributo, texto, marcado)
+_MODEL_SPEC = (
+    ("model_virtio", "virtio (recomendado)", True),
+    ("model_e1000", "e1000 (Intel)", False),
+    ("model_rtl", "rtl8139 (Realtek)", False),
+)
+
 
 class NetworkDialog(QDialog):
     """Diálogo para gestionar redes"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        
+        # Agrupa cambios seguidos del tipo de red en un solo setHtml
+        self._pending_net_type = None
+        self._last_net_type = None
+        self._net_info_timer = QTimer(self)
+        self._net_info_timer.setSingleShot(True)
+        self._net_info_timer.setInterval(_INFO_DEBOUNCE_MS)
+        self._net_info_timer.timeout.connect(self._apply_network_info)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -20,13 +73,10 @@ class NetworkDialog(QDialog):
         self.setGeometry(100, 100, 800, 500)
         
         layout = QVBoxLayout()
-        self.tabs = QTabWidget()
-        
-        create_tab = self.create_network_tab()
-        self.tabs.addTab(create_tab, "Crear Red")
-        
-        config_tab = self.network_config_tab()
-        self.tabs.addTab(config_tab, "Configurar Red")
+        # Cada pestaña se construye al mostrarse por primera vez
+        self.tabs = LazyTabWidget()
+        self.tabs.add_lazy_tab(self.create_network_tab, "Crear Red")
+        self.tabs.add_lazy_tab(self.network_config_tab, "Configurar Red")
         
         layout.addWidget(self.tabs)
         
@@ -36,33 +86,39 @@ class NetworkDialog(QDialog):
         
         self.setLayout(layout)
     
+    def _build_fields(self, layout, spec):
+        """
+        Crea los widgets descritos en una tabla de campos
+        
+        Cada entrada es (atributo, clase, opciones, etiqueta). El widget se
+        guarda como self.<atributo> y se agrega como fila de layout.
+        """
+        for attr, widget_cls, opts, label in spec:
+            widget = widget_cls(opts["caption"]) if "caption" in opts else widget_cls()
+            if "items" in opts:
+                widget.addItems(opts["items"])
+            if "text" in opts:
+                widget.setText(opts["text"])
+            if "checked" in opts:
+                widget.setChecked(opts["checked"])
+            if "range" in opts:
+                widget.setRange(*opts["range"])
+            if "value" in opts:
+                widget.setValue(opts["value"])
+            if "read_only" in opts:
+                widget.setReadOnly(opts["read_only"])
+            if "max_height" in opts:
+                widget.setMaximumHeight(opts["max_height"])
+            if "on_text" in opts:
+                widget.currentTextChanged.connect(getattr(self, opts["on_text"]))
+            setattr(self, attr, widget)
+            layout.addRow(label, widget)
+    
     def create_network_tab(self):
         widget = QWidget()
         layout = QFormLayout()
         
-        self.net_name = QLineEdit()
-        layout.addRow("Nombre de la Red:", self.net_name)
-        
-        self.net_type = QComboBox()
-        self.net_type.addItems(["user", "bridge", "tap", "vde"])
-        self.net_type.currentTextChanged.connect(self.update_network_info)
-        layout.addRow("Tipo de Red:", self.net_type)
-        
-        self.net_subnet = QLineEdit()
-        self.net_subnet.setText("192.168.122.0/24")
-        layout.addRow("Subred (CIDR):", self.net_subnet)
-        
-        self.net_dhcp = QCheckBox("Habilitar DHCP")
-        self.net_dhcp.setChecked(True)
-        layout.addRow("DHCP:", self.net_dhcp)
-        
-        self.net_ipv6 = QCheckBox("Habilitar IPv6")
-        layout.addRow("IPv6:", self.net_ipv6)
-        
-        self.net_info = QTextEdit()
-        self.net_info.setReadOnly(True)
-        self.net_info.setMaximumHeight(150)
-        layout.addRow("Información:", self.net_info)
+        self._build_fields(layout, _CREATE_SPEC)
         
         btn_create = QPushButton("Crear Red")
         btn_create.clicked.connect(self.create_network)
@@ -82,31 +138,18 @@ class NetworkDialog(QDialog):
         main_layout.addWidget(title)
         
         # Opciones de modelo
-        self.model_virtio = QCheckBox("virtio (recomendado)")
-        self.model_virtio.setChecked(True)
-        main_layout.addWidget(self.model_virtio)
-        
-        self.model_e1000 = QCheckBox("e1000 (Intel)")
-        main_layout.addWidget(self.model_e1000)
-        
-        self.model_rtl = QCheckBox("rtl8139 (Realtek)")
-        main_layout.addWidget(self.model_rtl)
+        for attr, caption, checked in _MODEL_SPEC:
+            checkbox = QCheckBox(caption)
+            checkbox.setChecked(checked)
+            setattr(self, attr, checkbox)
+            main_layout.addWidget(checkbox)
         
         # Espaciador
         main_layout.addSpacing(20)
         
         # Configuración avanzada
         form_layout = QFormLayout()
-        
-        self.net_mtu = QSpinBox()
-        self.net_mtu.setValue(1500)
-        self.net_mtu.setRange(68, 65535)
-        form_layout.addRow("MTU (bytes):", self.net_mtu)
-        
-        self.net_vlan = QSpinBox()
-        self.net_vlan.setValue(0)
-        self.net_vlan.setRange(0, 4094)
-        form_layout.addRow("VLAN ID:", self.net_vlan)
+        self._build_fields(form_layout, _CONFIG_SPEC)
         
         main_layout.addLayout(form_layout)
         main_layout.addStretch()
@@ -114,18 +157,26 @@ class NetworkDialog(QDialog):
         widget.setLayout(main_layout)
         return widget
     
+    def _queue_network_info(self, net_type):
+        """Programa la actualización del panel de información"""
+        self._pending_net_type = net_type
+        self._net_info_timer.start()
+    
+    def _apply_network_info(self):
+        """Aplica el último tipo de red pendiente"""
+        self.update_network_info(self._pending_net_type)
+    
     def update_network_info(self, net_type):
         """Actualiza la información de la red según el tipo seleccionado"""
-        info_text = f"<b>Tipo de Red: {net_type}</b><br><br>"
-        
-        descriptions = {
-            "user": "✓ Sin configuración de red del host<br>✓ NAT automático<br>✓ Fácil de usar",
-            "bridge": "✓ VM en la misma red que el host<br>✓ Requiere configuración bridge<br>✓ Mayor control",
-            "tap": "✓ Interfaz tap en el host<br>✓ Mayor flexibilidad<br>✓ Requiere permisos root",
-            "vde": "✓ Virtual Distributed Ethernet<br>✓ Para entornos complejos<br>✓ Requiere VDE instalado"
-        }
+        # Mismo tipo que el mostrado: no volver a procesar el HTML
+        if net_type == self._last_net_type:
+            return
+        self._last_net_type = net_type
         
-        info_text += descriptions.get(net_type, "Información no disponible")
+        info_text = (
+            f"<b>Tipo de Red: {net_type}</b><br><br>"
+            + _NET_DESCRIPTIONS.get(net_type, "Información no disponible")
+        )
         self.net_info.setHtml(info_text)
     
     def create_network(self):
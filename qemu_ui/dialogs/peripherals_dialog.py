@@ -5,8 +5,9 @@ Diálogo para administrar periféricos
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QComboBox, QCheckBox, QSpinBox, QListWidget, QFormLayout, QTabWidget, QWidget,QLineEdit
+    QComboBox, QCheckBox, QSpinBox, QListWidget, QFormLayout, QWidget,QLineEdit
 )
+from qemu_ui.widgets import LazyTabWidget
 
 class PeripheralsDialog(QDialog):
     """Diálogo para administrar periféricos"""
@@ -20,22 +21,13 @@ class PeripheralsDialog(QDialog):
         self.setGeometry(100, 100, 900, 600)
         
         layout = QVBoxLayout()
-        self.tabs = QTabWidget()
-        
-        usb_tab = self.usb_tab()
-        self.tabs.addTab(usb_tab, "USB")
-        
-        audio_tab = self.audio_tab()
-        self.tabs.addTab(audio_tab, "Audio")
-        
-        input_tab = self.input_tab()
-        self.tabs.addTab(input_tab, "Entrada (Input)")
-        
-        serial_tab = self.serial_tab()
-        self.tabs.addTab(serial_tab, "Puerto Serial")
-        
-        other_tab = self.other_tab()
-        self.tabs.addTab(other_tab, "Otros")
+        # Cada pestaña se construye al mostrarse por primera vez
+        self.tabs = LazyTabWidget()
+        self.tabs.add_lazy_tab(self.usb_tab, "USB")
+        self.tabs.add_lazy_tab(self.audio_tab, "Audio")
+        self.tabs.add_lazy_tab(self.input_tab, "Entrada (Input)")
+        self.tabs.add_lazy_tab(self.serial_tab, "Puerto Serial")
+        self.tabs.add_lazy_tab(self.other_tab, "Otros")
         
         layout.addWidget(self.tabs)
         
@@ -62,7 +54,7 @@ class PeripheralsDialog(QDialog):
         layout.addRow("Puertos USB:", self.usb_ports)
         
         self.usb_redirect = QCheckBox("Habilitar redirección USB")
-        layout.addRow("", self.usb_redirect)
+        layout.addRow(self.usb_redirect)
         
         widget.setLayout(layout)
         return widget
@@ -73,7 +65,7 @@ class PeripheralsDialog(QDialog):
         
         self.audio_enabled = QCheckBox("Habilitar Audio")
         self.audio_enabled.setChecked(True)
-        layout.addRow("", self.audio_enabled)
+        layout.addRow(self.audio_enabled)
         
         self.audio_driver = QComboBox()
         self.audio_driver.addItems(["pulseaudio", "alsa", "oss", "coreaudio"])
@@ -99,7 +91,7 @@ class PeripheralsDialog(QDialog):
         layout.addRow("Tipo de Teclado:", self.keyboard_type)
         
         self.grab_input = QCheckBox("Captura automática de entrada")
-        layout.addRow("", self.grab_input)
+        layout.addRow(self.grab_input)
         
         widget.setLayout(layout)
         return widget
@@ -109,7 +101,7 @@ class PeripheralsDialog(QDialog):
         layout = QFormLayout()
         
         self.serial_enabled = QCheckBox("Habilitar Puerto Serial")
-        layout.addRow("", self.serial_enabled)
+        layout.addRow(self.serial_enabled)
         
         self.serial_device = QComboBox()
         self.serial_device.addItems(["pty", "file", "socket", "tcp"])
@@ -124,21 +116,23 @@ class PeripheralsDialog(QDialog):
     
     def other_tab(self):
         widget = QWidget()
-        layout = QFormLayout()
+        # Solo casillas: no hace falta la columna de etiquetas de QFormLayout
+        layout = QVBoxLayout()
         
         self.parallel = QCheckBox("Habilitar Puerto Paralelo")
-        layout.addRow("", self.parallel)
+        layout.addWidget(self.parallel)
         
         self.watchdog = QCheckBox("Habilitar Watchdog Timer")
-        layout.addRow("", self.watchdog)
+        layout.addWidget(self.watchdog)
         
         self.virtio_rng = QCheckBox("Habilitar RNG Virtio")
-        layout.addRow("", self.virtio_rng)
+        layout.addWidget(self.virtio_rng)
         
         self.balloon = QCheckBox("Habilitar Balloon Device")
         self.balloon.setChecked(True)
-        layout.addRow("", self.balloon)
+        layout.addWidget(self.balloon)
         
+        layout.addStretch()
         widget.setLayout(layout)
         return widget
 
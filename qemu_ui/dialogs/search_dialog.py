@@ -5,18 +5,123 @@ Diálogo para buscar discos y máquinas
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QLineEdit, QListWidget, QCheckBox, QFileDialog, QMessageBox
+    QLineEdit, QListView, QCheckBox, QFileDialog
 )
+from PyQt5.QtCore import QThread, QStringListModel, pyqtSignal
 from pathlib import Path
 import os
 
 
+# Cantidad de resultados que se acumulan antes de enviarlos a la UI
+_BATCH_SIZE = 256
+
+# Directorios que no se recorren: no contienen discos ni ISOs y suelen ser
+# enormes (los ocultos se saltan además salvo que se pida incluirlos)
+_PRUNE = frozenset({
+    '.git', '.cache', 'node_modules', '__pycache__', '.venv', 'venv',
+    '.local', '.npm', 'snap',
+})
+
+
+class SearchWorker(QThread):
+    """Worker thread que recorre una ruta buscando archivos por extensión"""
+    
+    results_ready = pyqtSignal(list)
+    error = pyqtSignal(str)
+    finished = pyqtSignal(int)
+    
+    def __init__(self, search_path, suffixes, include_hidden=False):
+        super().__init__()
+        self.search_path = search_path
+        self.suffixes = suffixes
+        self.include_hidden = include_hidden
+        self._abort = False
+    
+    @staticmethod
+    def _describe_error(error):
+        """Mensaje legible para un fallo al abrir la ruta de búsqueda"""
+        if isinstance(error, FileNotFoundError):
+            return "La ruta no existe"
+        if isinstance(error, NotADirectoryError):
+            return "La ruta no es un directorio"
+        if isinstance(error, PermissionError):
+            return "Sin permisos para leer la ruta"
+        return str(error)
+    
+    def abort(self):
+        """Pide al worker que termine cuanto antes (no bloquea)"""
+        self._abort = True
+    
+    def was_aborted(self):
+        """Indica si la búsqueda se detuvo antes de terminar"""
+        return self._abort
+    
+    def run(self):
+        """
+        Recorre el árbol una sola vez con os.scandir y una pila explícita
+        
+        Todas las extensiones se comprueban en la misma pasada; los
+        resultados se envían en lotes de _BATCH_SIZE. Si la ruta raíz no se
+        puede abrir se emite error; los subdirectorios ilegibles se omiten.
+        """
+        found = 0
+        batch = []
+        suffixes = self.suffixes
+        # Con una sola extensión, endswith(str) evita recorrer una tupla
+        if len(suffixes) == 1:
+            suffixes = suffixes[0]
+        skip_hidden = not self.include_hidden
+        stack = [self.search_path]
+        
+        try:
+            while stack and suffixes and not self._abort:
+                dir_path = stack.pop()
+                try:
+                    entries = os.scandir(dir_path)
+                except OSError as e:
+                    if dir_path == self.search_path:
+                        self.error.emit(self._describe_error(e))
+                    continue
+                
+                try:
+                    with entries:
+                        for entry in entries:
+                            if self._abort:
+                                break
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    name = entry.name
+                                    if name in _PRUNE or (skip_hidden and name.startswith('.')):
+                                        continue
+                                    stack.append(entry.path)
+                                elif entry.name.endswith(suffixes) and entry.is_file():
+                                    batch.append(entry.path)
+                                    if len(batch) >= _BATCH_SIZE:
+                                        found += len(batch)
+                                        self.results_ready.emit(batch)
+                                        batch = []
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+        except Exception as e:
+            self.error.emit(str(e))
+        
+        if batch:
+            found += len(batch)
+            self.results_ready.emit(batch)
+        
+        self.finished.emit(found)
+
+
 class SearchDialog(QDialog):
     """Diálogo para buscar discos y máquinas"""
     
     def __init__(self, parent=None, storage_adapter=None):
         super().__init__(parent)
         self.storage = storage_adapter
+        self.search_worker = None
+        self._search_failed = False
         self.init_ui()
     
     def init_ui(self):
@@ -29,7 +134,6 @@ class SearchDialog(QDialog):
         search_layout.addWidget(QLabel("Ruta de búsqueda:"))
         
         self.search_path = QLineEdit()
-        from pathlib import Path
         self.search_path.setText(str(Path.home()))
         search_layout.addWidget(self.search_path)
         
@@ -49,15 +153,41 @@ class SearchDialog(QDialog):
         self.search_iso.setChecked(True)
         options_layout.addWidget(self.search_iso)
         
+        self.include_hidden = QCheckBox("Incluir ocultos")
+        self.include_hidden.setToolTip("Recorrer también directorios que empiezan con punto")
+        options_layout.addWidget(self.include_hidden)
+        
         layout.addLayout(options_layout)
         
-        search_btn = QPushButton("🔍 Iniciar búsqueda")
-        search_btn.clicked.connect(self.start_search)
-        layout.addWidget(search_btn)
+        buttons_layout = QHBoxLayout()
+        
+        self.search_btn = QPushButton("🔍 Iniciar búsqueda")
+        self.search_btn.clicked.connect(self.start_search)
+        buttons_layout.addWidget(self.search_btn)
+        
+        self.cancel_btn = QPushButton("Cancelar")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_search)
+        buttons_layout.addWidget(self.cancel_btn)
+        
+        layout.addLayout(buttons_layout)
         
-        self.results_list = QListWidget()
+        # Modelo de cadenas simple: sin un QListWidgetItem por resultado
+        self.results_model = QStringListModel(self)
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
+        self.results_list.setEditTriggers(QListView.NoEditTriggers)
+        # Todas las filas miden lo mismo: evita medir cada elemento
+        self.results_list.setUniformItemSizes(True)
+        # Distribuir las filas por lotes sin bloquear el bucle de eventos
+        self.results_list.setLayoutMode(QListView.Batched)
+        self.results_list.setBatchSize(_BATCH_SIZE)
         layout.addWidget(self.results_list)
         
+        # Estado de la búsqueda (se actualiza con cada lote de resultados)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+        
         close_btn = QPushButton("Cerrar")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
@@ -70,78 +200,74 @@ class SearchDialog(QDialog):
             self.search_path.setText(path)
     
     def start_search(self):
-        from pathlib import Path
-        self.results_list.clear()
-        
-        search_path = self.search_path.text()
-        if not os.path.exists(search_path):
-            QMessageBox.warning(self, "Error", "La ruta no existe")
+        """Lanza la búsqueda en un hilo aparte"""
+        if self.search_worker and self.search_worker.isRunning():
             return
         
-        extensions = []
-        if self.search_qcow2.isChecked():
-            extensions.append("*.qcow2")
-        if self.search_iso.isChecked():
-            extensions.append("*.iso")
+        self.results_model.setStringList([])
         
-        try:
-            found = 0
-            for ext in extensions:
-                for file_path in Path(search_path).rglob(ext):
-                    if file_path.is_file():
-                        self.results_list.addItem(str(file_path))
-                        found += 1
-            
-            QMessageBox.information(self, "Búsqueda", f"Se encontraron {found} archivo(s)")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-
-
+        search_path = self.search_path.text()
+        self._search_failed = False
         
-        title = QLabel("QEMU Manager Pro")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        layout.addWidget(title)
-        
-        version = QLabel("Versión 3.0 - Arquitectura Hexagonal")
-        version_font = QFont()
-        version_font.setPointSize(11)
-        version.setFont(version_font)
-        layout.addWidget(version)
-        
-        layout.addSpacing(20)
-        
-        description = QLabel(
-            "Gestor gráfico completo para máquinas virtuales QEMU con arquitectura hexagonal.\n\n"
-            "<b>Características:</b><br>"
-            "• Crear y gestionar máquinas virtuales<br>"
-            "• Detección automática de VMs existentes<br>"
-            "• Administrador completo de discos virtuales<br>"
-            "• Configuración avanzada de hardware, video y red<br>"
-            "• Administrador de periféricos (USB, Audio, Serial)<br>"
-            "• Búsqueda de discos y máquinas<br>"
-            "• Importación y exportación de configuraciones<br><br>"
-            "<b>Requisitos:</b><br>"
-            "• QEMU instalado en el sistema<br>"
-            "• PyQt5<br>"
-            "• Permisos de usuario para QEMU"
+        suffixes = tuple(
+            suffix for suffix, checkbox in (
+                (".qcow2", self.search_qcow2),
+                (".iso", self.search_iso),
+            )
+            if checkbox.isChecked()
         )
-        layout.addWidget(description)
-        
-        layout.addSpacing(20)
-        
-        copyright_label = QLabel("© 2025 QEMU Manager\nLicencia: GPL v3\nArquitectura: Hexagonal (Puertos y Adaptadores)")
-        copyright_label.setStyleSheet("color: gray; font-size: 9pt;")
-        layout.addWidget(copyright_label)
         
-        layout.addStretch()
+        self.search_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.status_label.setText("Buscando...")
         
-        ok_btn = QPushButton("Cerrar")
-        ok_btn.clicked.connect(self.close)
-        layout.addWidget(ok_btn)
+        self.search_worker = SearchWorker(
+            search_path, suffixes, self.include_hidden.isChecked()
+        )
+        self.search_worker.results_ready.connect(self.on_results_ready)
+        self.search_worker.error.connect(self.on_search_error)
+        self.search_worker.finished.connect(self.on_search_finished)
+        self.search_worker.start()
+    
+    def on_results_ready(self, paths):
+        """
+        Agrega un lote de resultados al final del modelo
         
-        self.setLayout(layout)
-
-
+        insertRows solo añade las filas nuevas: no copia la lista completa ni
+        resetea el modelo, así que se conservan el scroll y la selección.
+        """
+        model = self.results_model
+        start = model.rowCount()
+        model.insertRows(start, len(paths))
+        for offset, path in enumerate(paths):
+            model.setData(model.index(start + offset), path)
+        self.status_label.setText(f"Buscando... Encontrados: {model.rowCount()}")
+    
+    def cancel_search(self):
+        """Detiene la búsqueda en curso; los resultados parciales se conservan"""
+        if self.search_worker and self.search_worker.isRunning():
+            self.search_worker.abort()
+            self.cancel_btn.setEnabled(False)
+    
+    def on_search_finished(self, found):
+        """Cuando el worker terminó de recorrer la ruta"""
+        self.search_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        if self._search_failed:
+            return
+        if self.search_worker and self.search_worker.was_aborted():
+            self.status_label.setText(f"Búsqueda cancelada: {found} archivo(s)")
+        else:
+            self.status_label.setText(f"Búsqueda completa: {found} archivo(s)")
+    
+    def on_search_error(self, message):
+        """Error del worker (ruta inválida o fallo inesperado)"""
+        self._search_failed = True
+        self.status_label.setText(f"Error: {message}")
+    
+    def closeEvent(self, event):
+        """Detiene la búsqueda en curso al cerrar el diálogo"""
+        if self.search_worker and self.search_worker.isRunning():
+            self.search_worker.abort()
+            self.search_worker.wait()
+        super().closeEvent(event)
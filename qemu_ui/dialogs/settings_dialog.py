@@ -5,17 +5,20 @@ Diálogo de configuración de la aplicación
 """
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
+    QDialog, QVBoxLayout, QHBoxLayout, QWidget,
     QFormLayout, QComboBox, QSpinBox, QLineEdit, QPushButton,
     QLabel, QMessageBox, QFileDialog
 )
 from PyQt5.QtCore import Qt
+from qemu_ui.widgets import LazyTabWidget
 
 # Importar el gestor de configuración
 try:
-    from qemu_adapters.config_manager import get_config
+    from qemu_adapters.config_manager import get_config, ConfigManager
 except ImportError:
     # Si no existe aún, usar valores dummy
+    ConfigManager = None
+    
     def get_config():
         class DummyConfig:
             CONFIG_FILE = "config.json"
@@ -33,6 +36,20 @@ except ImportError:
         return DummyConfig()
 
 
+# Opciones de aceleración (texto, valor) y posición de cada valor en el combo
+_ACCEL_OPTIONS = (
+    ("Ninguna (Más lento)", "none"),
+    ("KVM (Linux)", "kvm"),
+    ("WHPX (Windows 11)", "whpx"),
+    ("HAX (Intel)", "hax"),
+    ("TCG (Genérico)", "tcg"),
+)
+_ACCEL_INDEX = {value: i for i, (_text, value) in enumerate(_ACCEL_OPTIONS)}
+
+# Nombre mostrado de cada tema
+_THEME_DISPLAY = {"light": "Claro", "dark": "Oscuro"}
+
+
 class SettingsDialog(QDialog):
     """Diálogo para cambiar configuración de la aplicación"""
     
@@ -47,22 +64,13 @@ class SettingsDialog(QDialog):
         
         layout = QVBoxLayout()
         
-        # Tabs
-        tabs = QTabWidget()
-        
-        # Tab: Hardware
-        hardware_tab = self.create_hardware_tab()
-        tabs.addTab(hardware_tab, "Hardware")
+        # Tabs (cada una se construye al mostrarse por primera vez)
+        self.tabs = LazyTabWidget()
+        self.tabs.add_lazy_tab(self.create_hardware_tab, "Hardware")
+        self.tabs.add_lazy_tab(self.create_paths_tab, "Directorios")
+        self.tabs.add_lazy_tab(self.create_ui_tab, "Interfaz")
         
-        # Tab: Directorios
-        paths_tab = self.create_paths_tab()
-        tabs.addTab(paths_tab, "Directorios")
-        
-        # Tab: Interfaz
-        ui_tab = self.create_ui_tab()
-        tabs.addTab(ui_tab, "Interfaz")
-        
-        layout.addWidget(tabs)
+        layout.addWidget(self.tabs)
         
         # Botones
         button_layout = QHBoxLayout()
@@ -95,23 +103,13 @@ class SettingsDialog(QDialog):
         form1 = QFormLayout()
         
         self.accel_combo = QComboBox()
-        accel_options = [
-            ("Ninguna (Más lento)", "none"),
-            ("KVM (Linux)", "kvm"),
-            ("WHPX (Windows 11)", "whpx"),
-            ("HAX (Intel)", "hax"),
-            ("TCG (Genérico)", "tcg")
-        ]
-        
-        for text, value in accel_options:
+        for text, value in _ACCEL_OPTIONS:
             self.accel_combo.addItem(text, value)
         
         # Seleccionar el tipo actual
-        current_accel = self.config.get_acceleration_type()
-        for i in range(self.accel_combo.count()):
-            if self.accel_combo.itemData(i) == current_accel:
-                self.accel_combo.setCurrentIndex(i)
-                break
+        self.accel_combo.setCurrentIndex(
+            _ACCEL_INDEX.get(self.config.get_acceleration_type(), 0)
+        )
         
         form1.addRow("Tipo de Aceleración:", self.accel_combo)
         
@@ -211,9 +209,8 @@ class SettingsDialog(QDialog):
         form_layout = QFormLayout()
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Claro", "Oscuro"])
-        current_theme = self.config.get_theme()
-        self.theme_combo.setCurrentText("Claro" if current_theme == "light" else "Oscuro")
+        self.theme_combo.addItems(list(_THEME_DISPLAY.values()))
+        self.theme_combo.setCurrentText(_THEME_DISPLAY.get(self.config.get_theme(), "Oscuro"))
         form_layout.addRow("Tema:", self.theme_combo)
         
         layout.addLayout(form_layout)
@@ -233,6 +230,31 @@ class SettingsDialog(QDialog):
         widget.setLayout(layout)
         return widget
     
+    def _refresh_values_from_config(self):
+        """
+        Vuelve a cargar los valores de la configuración en los campos existentes
+        
+        No reconstruye widgets ni layouts. Las pestañas que aún no se han
+        mostrado leerán la configuración al construirse.
+        """
+        cfg = self.config
+        
+        if hasattr(self, "accel_combo"):
+            self.accel_combo.setCurrentIndex(
+                _ACCEL_INDEX.get(cfg.get_acceleration_type(), 0)
+            )
+            vm_defaults = cfg.get_vm_defaults()
+            self.cpu_spin.setValue(vm_defaults.get("cpus", 2))
+            self.ram_spin.setValue(vm_defaults.get("ram", 1024))
+            self.vga_combo.setCurrentText(vm_defaults.get("vga", "qxl"))
+        
+        if hasattr(self, "iso_path"):
+            self.iso_path.setText(cfg.get_iso_dir())
+            self.disk_path.setText(cfg.get_disk_dir())
+        
+        if hasattr(self, "theme_combo"):
+            self.theme_combo.setCurrentText(_THEME_DISPLAY.get(cfg.get_theme(), "Oscuro"))
+    
     def browse_iso_dir(self):
         """Abre diálogo para seleccionar directorio de ISOs"""
         path = QFileDialog.getExistingDirectory(
@@ -256,6 +278,9 @@ class SettingsDialog(QDialog):
     def save_settings(self):
         """Guarda los cambios de configuración"""
         try:
+            # Los campos de pestañas no visitadas deben existir para leerlos
+            self.tabs.ensure_all_built()
+            
             # Aceleración
             accel_type = self.accel_combo.currentData()
             self.config.set_acceleration_type(accel_type)
@@ -292,9 +317,10 @@ class SettingsDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             try:
-                from qemu_adapters.config_manager import ConfigManager
+                if ConfigManager is None:
+                    raise RuntimeError("Gestor de configuración no disponible")
                 self.config.save_config(ConfigManager.DEFAULT_CONFIG.copy())
-                self.init_ui()
+                self._refresh_values_from_config()
                 QMessageBox.information(self, "Éxito", "Configuración restaurada")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error restaurando: {e}")
\ No newline at end of file
@@ -6,6 +6,25 @@ from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QCheckBox, QSpinBox, QTextEdit, QScrollArea, QWidget, QPushButton, QFormLayout
 )
+from PyQt5.QtCore import QTimer
+
+
+# Tamaño inicial del diálogo
+_DIALOG_WIDTH = 700
+_DIALOG_HEIGHT = 600
+
+# Espera antes de redibujar el panel de información tras un cambio (ms)
+_INFO_DEBOUNCE_MS = 50
+
+# Descripción de cada tarjeta gráfica para el panel de información
+_VGA_DESCRIPTIONS = {
+    "qxl": "Optimizada para SPICE, excelente rendimiento",
+    "virtio": "Recomendada, mejor rendimiento 3D",
+    "vmware": "Compatible con VMware",
+    "vga": "Estándar VGA compatible",
+    "cirrus": "Legada, para SO antiguos",
+    "std": "Estándar, compatibilidad máxima"
+}
 
 
 class VideoDialog(QDialog):
@@ -13,11 +32,20 @@ class VideoDialog(QDialog):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        
+        # Agrupa cambios seguidos de tarjeta en un solo setHtml
+        self._pending_vga_type = None
+        self._last_vga_type = None
+        self._video_info_timer = QTimer(self)
+        self._video_info_timer.setSingleShot(True)
+        self._video_info_timer.setInterval(_INFO_DEBOUNCE_MS)
+        self._video_info_timer.timeout.connect(self._apply_video_info)
+        
         self.init_ui()
     
     def init_ui(self):
         self.setWindowTitle("Configuración de Video")
-        self.setGeometry(100, 100, 700, 600)
+        self.setGeometry(100, 100, _DIALOG_WIDTH, _DIALOG_HEIGHT)
         
         # Usar QVBoxLayout para poder usar addSpacing()
         main_layout = QVBoxLayout()
@@ -28,7 +56,7 @@ class VideoDialog(QDialog):
         
         self.vga_type = QComboBox()
         self.vga_type.addItems(["qxl", "virtio", "vmware", "vga", "cirrus", "std"])
-        self.vga_type.currentTextChanged.connect(self.update_video_info)
+        self.vga_type.currentTextChanged.connect(self._queue_video_info)
         layout.addRow("Tipo de Tarjeta Gráfica:", self.vga_type)
         
         main_layout.addLayout(layout)
@@ -83,35 +111,54 @@ class VideoDialog(QDialog):
         
         self.update_video_info(self.vga_type.currentText())
         
-        # Contenedor con scroll
         widget = QWidget()
         widget.setLayout(main_layout)
         
-        scroll = QScrollArea()
-        scroll.setWidget(widget)
-        scroll.setWidgetResizable(True)
-        
         # Layout final
         final_layout = QVBoxLayout()
-        final_layout.addWidget(scroll)
         
         close_btn = QPushButton("Cerrar")
         close_btn.clicked.connect(self.close)
+        
+        # Solo se usa scroll si el contenido no cabe en el tamaño inicial
+        margins = final_layout.contentsMargins()
+        available_width = _DIALOG_WIDTH - margins.left() - margins.right()
+        available_height = (
+            _DIALOG_HEIGHT - margins.top() - margins.bottom()
+            - close_btn.sizeHint().height() - final_layout.spacing()
+        )
+        hint = widget.sizeHint()
+        if hint.width() <= available_width and hint.height() <= available_height:
+            final_layout.addWidget(widget)
+        else:
+            # Contenedor con scroll
+            widget.setMinimumSize(hint)
+            scroll = QScrollArea()
+            scroll.setWidget(widget)
+            scroll.setWidgetResizable(True)
+            final_layout.addWidget(scroll)
+        
         final_layout.addWidget(close_btn)
         
         self.setLayout(final_layout)
     
+    def _queue_video_info(self, vga_type):
+        """Programa la actualización del panel de información"""
+        self._pending_vga_type = vga_type
+        self._video_info_timer.start()
+    
+    def _apply_video_info(self):
+        """Aplica la última tarjeta pendiente"""
+        self.update_video_info(self._pending_vga_type)
+    
     def update_video_info(self, vga_type):
-        info = f"<b>Tipo de Tarjeta: {vga_type}</b><br><br>"
-        
-        descriptions = {
-            "qxl": "Optimizada para SPICE, excelente rendimiento",
-            "virtio": "Recomendada, mejor rendimiento 3D",
-            "vmware": "Compatible con VMware",
-            "vga": "Estándar VGA compatible",
-            "cirrus": "Legada, para SO antiguos",
-            "std": "Estándar, compatibilidad máxima"
-        }
-        
-        info += descriptions.get(vga_type, "Información no disponible")
+        # Misma tarjeta que la mostrada: no volver a procesar el HTML
+        if vga_type == self._last_vga_type:
+            return
+        self._last_vga_type = vga_type
+        
+        info = (
+            f"<b>Tipo de Tarjeta: {vga_type}</b><br><br>"
+            + _VGA_DESCRIPTIONS.get(vga_type, "Información no disponible")
+        )
         self.video_info.setHtml(info)
\ No newline at end of file
@@ -1,60 +1,181 @@
 # qemu_ui/main_window.py
 
-import sys
+import os
+import re
+import logging
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QLineEdit, QSpinBox, QComboBox, QListWidget, QListWidgetItem, QTabWidget,
     QGroupBox, QFileDialog, QMessageBox, QCheckBox, QFormLayout, QTextEdit,
     QTableWidget, QTableWidgetItem, QProgressBar, QDoubleSpinBox, QSlider,
-    QScrollArea, QDialog
+    QScrollArea, QDialog, QListView
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread
-from PyQt5.QtGui import QFont, QColor
-
-from qemu_ui.dialogs.disk_manager_dialog import DiskManagerDialog
-from qemu_ui.dialogs.network_dialog import NetworkDialog
-from qemu_ui.dialogs.video_dialog import VideoDialog
-from qemu_ui.dialogs.peripherals_dialog import PeripheralsDialog
-from qemu_ui.dialogs.about_dialog import AboutDialog
-from qemu_ui.dialogs.search_dialog import SearchDialog
-from qemu_ui.dialogs.settings_dialog import SettingsDialog
+from PyQt5.QtGui import QFont, QColor, QBrush
+
 from qemu_adapters.config_manager import get_config
+from qemu_adapters.process_scanner import iter_qemu_processes, terminate_qemu_processes
 
 from qemu_domain.models import VMStatus
 
+logger = logging.getLogger('qemu_manager')
+
+_HELP_HTML = """
+<b>QEMU Manager - Ayuda</b><br><br>
+
+<b>Funcionalidades:</b><br>
+• <b>Nueva VM:</b> Crear una nueva máquina virtual<br>
+• <b>Buscar:</b> Buscar discos e imágenes existentes<br>
+• <b>Importar:</b> Importar discos existentes<br>
+• <b>Iniciar/Detener:</b> Controlar máquinas virtuales<br><br>
+
+<b>Atajos de teclado:</b><br>
+• Ctrl+N: Nueva VM<br>
+• Ctrl+F: Buscar<br>
+• Ctrl+O: Cargar configuración<br>
+• Ctrl+S: Guardar configuración<br>
+• F5: Actualizar lista<br>
+• Ctrl+Q: Salir<br>
+"""
+
+# Menús: (etiqueta, entradas); cada entrada es (texto, slot, atajo) o None
+# para un separador
+_MENU_SPEC = (
+    ("📁 Archivo", (
+        ("Nueva VM", "new_vm", "Ctrl+N"),
+        None,
+        ("🔍 Buscar Discos/Máquinas", "open_search_dialog", "Ctrl+F"),
+        None,
+        ("📂 Cargar Configuración", "load_config_file", "Ctrl+O"),
+        ("💾 Guardar Configuración", "save_all_configs", "Ctrl+S"),
+        None,
+        ("Salir", "close", "Ctrl+Q"),
+    )),
+    ("✏️ Editar", (
+        ("Actualizar Lista", "refresh_vm_list", "F5"),
+        None,
+        ("📥 Importar VM", "import_vm", None),
+        ("📤 Exportar VM", "export_vm", None),
+    )),
+    ("🔧 Herramientas", (
+        ("💾 Administrador de Discos", "open_disk_manager", None),
+        ("🌐 Administrador de Redes", "open_network_dialog", None),
+        ("🎬 Configuración de Video", "open_video_dialog", None),
+        ("🖨️ Administrador de Periféricos", "open_peripherals_dialog", None),
+    )),
+    ("⚙️ Configuración", (
+        ("Preferencias", "open_settings_dialog", "Ctrl+,"),
+    )),
+    ("❓ Ayuda", (
+        ("📋 Acerca de", "show_about", None),
+        ("📖 Ayuda", "show_help", None),
+    )),
+)
+
+# Items de la lista de VMs que se distribuyen por lote
+_LIST_BATCH_SIZE = 64
+
+# Tipos de _notify: (icono, título por defecto)
+_NOTIFY_KINDS = {
+    'success': (QMessageBox.Information, "Éxito"),
+    'warning': (QMessageBox.Warning, "Advertencia"),
+    'error': (QMessageBox.Critical, "Error"),
+}
+
+# Pausa entre detener y volver a iniciar una VM al reiniciarla
+_RESTART_DELAY_MS = 1000
+
 
 class VMListPresenter:
     """Adaptador que convierte lógica de negocio a eventos UI"""
     
+    # Colores compartidos por todos los items (QColor no requiere QApplication)
+    _COLOR_AUTO = QColor(Qt.blue)
+    _COLOR_RUN = QColor(144, 238, 144)  # lightgreen
+    # Sin brush: el item usa la paleta del tema
+    _NO_BRUSH = QBrush()
+    
     def __init__(self, vm_list_widget: QListWidget, info_label: QLabel):
         self.vm_list = vm_list_widget
         self.info_label = info_label
+        # Items ya mostrados y el estado (auto_detected, running) con que se pintaron
+        self._items_by_name = {}
+        self._item_states = {}
+        # Orden alfabético de la última lista; se reutiliza si los nombres no cambian
+        self._sorted_names = []
+        self._name_set = frozenset()
     
     def present_vms(self, vms, running_vms=None):
-        """Presenta lista de VMs en la UI"""
+        """Presenta lista de VMs en la UI (solo aplica las diferencias)"""
         if running_vms is None:
             running_vms = {}
         
-        self.vm_list.clear()
-        for vm in sorted(vms, key=lambda x: x.name):
-            item = QListWidgetItem(vm.name)
-            
-            # Marcar VMs auto-detectadas
-            if vm.auto_detected:
-                item.setText(f"📦 {vm.name} (detectada)")
-                item.setForeground(QColor("blue"))
-            else:
-                item.setText(f"⚙️ {vm.name}")
+        new = {vm.name: vm for vm in vms}
+        
+        # Congelar repintado y señales: Qt agrupa todo en un único repintado
+        self.vm_list.setUpdatesEnabled(False)
+        self.vm_list.blockSignals(True)
+        try:
+            # Quitar las VMs que ya no existen
+            for name in set(self._items_by_name) - set(new):
+                item = self._items_by_name.pop(name)
+                self._item_states.pop(name, None)
+                self.vm_list.takeItem(self.vm_list.row(item))
             
-            # Marcar VMs en ejecución
-            if vm.name in running_vms:
-                item.setText(item.text() + " [EJECUTANDO]")
-                item.setBackground(QColor("lightgreen"))
+            # Comparar conjuntos es O(N); solo se reordena si hubo altas o bajas
+            if new.keys() != self._name_set:
+                self._name_set = frozenset(new)
+                self._sorted_names = sorted(new)
             
-            self.vm_list.addItem(item)
+            # Recorrer en orden: las filas anteriores ya están colocadas, así
+            # que cada VM nueva se inserta directamente en su posición
+            for row, name in enumerate(self._sorted_names):
+                state = (new[name].auto_detected, name in running_vms)
+                item = self._items_by_name.get(name)
+                if item is None:
+                    item = QListWidgetItem()
+                    # Nombre canónico: no hay que reconstruirlo desde el texto
+                    item.setData(Qt.UserRole, name)
+                    self._items_by_name[name] = item
+                    self.vm_list.insertItem(row, item)
+                elif self._item_states.get(name) == state:
+                    continue
+                
+                self._item_states[name] = state
+                self._paint_item(item, name, *state)
+        finally:
+            self.vm_list.blockSignals(False)
+            self.vm_list.setUpdatesEnabled(True)
         
         self.info_label.setText(f"Total de VMs: {len(vms)}")
     
+    def present_running_state(self, name, running):
+        """Actualiza solo la fila de una VM cuando cambia su estado de ejecución"""
+        item = self._items_by_name.get(name)
+        if item is None:
+            return
+        
+        auto_detected = self._item_states[name][0]
+        state = (auto_detected, running)
+        if self._item_states[name] != state:
+            self._item_states[name] = state
+            self._paint_item(item, name, *state)
+    
+    def _paint_item(self, item, name, auto_detected, running):
+        """Aplica texto y colores de un item según su estado"""
+        # Marcar VMs auto-detectadas
+        text = f"📦 {name} (detectada)" if auto_detected else f"⚙️ {name}"
+        
+        # Marcar VMs en ejecución
+        if running:
+            text += " [EJECUTANDO]"
+        
+        item.setText(text)
+        item.setForeground(self._COLOR_AUTO if auto_detected else self._NO_BRUSH)
+        item.setBackground(self._COLOR_RUN if running else self._NO_BRUSH)
+    
     def present_error(self, error: str):
         """Presenta errores"""
         QMessageBox.critical(None, "Error", error)
@@ -74,6 +195,8 @@ class ConfigFormPresenter:
         self.cpu_cores = form_widgets['cpus']
         self.ram_size = form_widgets['ram']
         self.os_type = form_widgets['os']
+        self.vga_type = form_widgets['vga']
+        self.boot_order = form_widgets['boot_order']
         self.auto_detect_label = form_widgets['status']
     
     def present_vm(self, vm):
@@ -84,6 +207,8 @@ class ConfigFormPresenter:
         self.cpu_cores.setValue(vm.cpus)
         self.ram_size.setValue(vm.ram)
         self.os_type.setCurrentText(vm.os)
+        self.vga_type.setCurrentText(getattr(vm, 'vga', 'qxl'))
+        self.boot_order.setCurrentText(getattr(vm, 'boot_order', 'Disco duro (para arrancar SO)'))
         
         status_text = "✓ Auto-detectada del sistema" if vm.auto_detected else "✓ Configuración manual"
         self.auto_detect_label.setText(status_text)
@@ -95,6 +220,8 @@ class ConfigFormPresenter:
         self.disk_path.clear()
         self.cpu_cores.setValue(2)
         self.ram_size.setValue(1024)
+        self.vga_type.setCurrentText("qxl")
+        self.boot_order.setCurrentText("Disco duro (para arrancar SO)")
         self.auto_detect_label.setText("")
     
     def get_vm_data(self):
@@ -105,15 +232,54 @@ class ConfigFormPresenter:
             'disk': self.disk_path.text(),
             'cpus': self.cpu_cores.value(),
             'ram': self.ram_size.value(),
-            'os': self.os_type.currentText()
+            'os': self.os_type.currentText(),
+            'vga': self.vga_type.currentText(),
+            'boot_order': self.boot_order.currentText()
         }
 
 
+class _DiskInfoError(Exception):
+    """Lleva el resultado fallido de get_disk_info fuera de la caché"""
+    
+    def __init__(self, result):
+        super().__init__(result.get('error'))
+        self.result = result
+
+
+@lru_cache(maxsize=64)
+def _cached_disk_info(storage_adapter, path, mtime):
+    """
+    get_disk_info memoizado; mtime en la clave invalida al cambiar el disco
+    
+    Los errores se lanzan en vez de retornarse: lru_cache no guarda
+    excepciones, así que un fallo transitorio (qemu-img ausente, disco
+    bloqueado por una VM) se reintenta en la siguiente consulta.
+    """
+    result = storage_adapter.get_disk_info(path)
+    if not result.get('info'):
+        raise _DiskInfoError(result)
+    return result
+
+
+def _get_disk_info(storage_adapter, path):
+    """Información del disco sin relanzar qemu-img si el archivo no cambió"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        # Sin mtime no hay clave fiable: el adaptador reporta el error
+        return storage_adapter.get_disk_info(path)
+    try:
+        return _cached_disk_info(storage_adapter, path, mtime)
+    except _DiskInfoError as e:
+        return e.result
+
+
 class InfoPanelPresenter:
     """Adaptador para mostrar información detallada"""
     
     def __init__(self, info_text: QTextEdit):
         self.info_text = info_text
+        self._last_html_hash = None
     
     def present_vm_info(self, vm, running_vms=None, storage_adapter=None):
         """Muestra información detallada de VM"""
@@ -140,22 +306,34 @@ class InfoPanelPresenter:
         """
         
         if storage_adapter and vm.disk:
-            disk_info = storage_adapter.get_disk_info(vm.disk)
+            disk_info = _get_disk_info(storage_adapter, vm.disk)
             if 'info' in disk_info and disk_info['info']:
                 info += f"<pre>{disk_info['info']}</pre>"
             else:
                 info += f"• Error: {disk_info.get('error', 'No se pudo obtener información')}<br>"
         
-        self.info_text.setHtml(info)
+        self._set_html(info)
     
     def present_error(self, error: str):
         """Muestra error en panel info"""
-        self.info_text.setHtml(f"<b>Error:</b> {error}")
+        self._set_html(f"<b>Error:</b> {error}")
+    
+    def _set_html(self, html):
+        """Llama a setHtml solo si el contenido cambió (parsear HTML es costoso)"""
+        html_hash = hash(html)
+        if html_hash == self._last_html_hash:
+            return
+        self._last_html_hash = html_hash
+        self.info_text.setHtml(html)
 
 
 class QEMUManagerUI(QMainWindow):
     """Ventana principal de la aplicación QEMU Manager"""
     
+    # Reenvía al hilo de la UI los avisos del ejecutor, que llegan desde sus
+    # hilos vigilantes
+    vmProcessExited = pyqtSignal(str)
+    
     def __init__(self, dependencies):
         super().__init__()
         
@@ -168,17 +346,32 @@ class QEMUManagerUI(QMainWindow):
         
         # Estado interno
         self.running_vms = {}
+        self._msg = None
+        
+        # Últimos directorios usados en los selectores de archivos; la primera
+        # vez se parte de los directorios de la configuración
+        config = get_config()
+        self._last_iso_dir = config.get_iso_dir()
+        self._last_disk_dir = config.get_disk_dir()
+        
+        # Diálogos: se importan y construyen al abrirlos por primera vez
+        self._disk_dialog = None
+        self._network_dialog = None
+        self._video_dialog = None
+        self._peripherals_dialog = None
+        self._search_dialog = None
+        self._about_dialog = None
         
         # Inicializar UI
         self.init_ui()
         self.load_initial_data()
 
         # NUEVO: Detectar y manejar VMs huérfanas
-        self.handle_orphaned_vms()        
-        # Timer para actualizar estado
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_vm_status)
-        self.status_timer.start(2000)
+        self.handle_orphaned_vms()
+        
+        # El ejecutor avisa cuando un proceso QEMU termina: no hace falta sondear
+        self.vmProcessExited.connect(self._on_vm_exited)
+        self.qemu_executor.on_process_finished = self.vmProcessExited.emit
     
     def init_ui(self):
         """Inicializa la interfaz de usuario"""
@@ -202,99 +395,54 @@ class QEMUManagerUI(QMainWindow):
         # Panel derecho
         right_panel = self.create_right_panel()
         main_layout.addWidget(right_panel, 2)
+        
+        # Presentadores: se crean una vez y conservan su estado entre eventos
+        # (items de la lista, último HTML mostrado)
+        self._list_presenter = VMListPresenter(self.vm_list, self.info_label)
+        self._form_presenter = ConfigFormPresenter({
+            'name': self.name_input,
+            'iso': self.iso_path,
+            'disk': self.disk_path,
+            'cpus': self.cpu_cores,
+            'ram': self.ram_size,
+            'os': self.os_type,
+            'vga': self.vga_type,
+            'boot_order': self.boot_order,
+            'status': self.auto_detect_label
+        })
+        self._info_presenter = InfoPanelPresenter(self.info_text)
     
     def create_menu_bar(self):
-        """Crea la barra de menús con acciones"""
+        """Crea la barra de menús con acciones a partir de _MENU_SPEC"""
         menubar = self.menuBar()
         
-        # Menú Archivo
-        file_menu = menubar.addMenu("📁 Archivo")
-        
-        new_vm_action = file_menu.addAction("Nueva VM")
-        new_vm_action.triggered.connect(self.new_vm)
-        new_vm_action.setShortcut("Ctrl+N")
-        
-        file_menu.addSeparator()
-        
-        search_action = file_menu.addAction("🔍 Buscar Discos/Máquinas")
-        search_action.triggered.connect(self.open_search_dialog)
-        search_action.setShortcut("Ctrl+F")
-        
-        file_menu.addSeparator()
-        
-        load_config_action = file_menu.addAction("📂 Cargar Configuración")
-        load_config_action.triggered.connect(self.load_config_file)
-        load_config_action.setShortcut("Ctrl+O")
-        
-        save_config_action = file_menu.addAction("💾 Guardar Configuración")
-        save_config_action.triggered.connect(self.save_all_configs)
-        save_config_action.setShortcut("Ctrl+S")
-        
-        file_menu.addSeparator()
-        
-        exit_action = file_menu.addAction("Salir")
-        exit_action.triggered.connect(self.close)
-        exit_action.setShortcut("Ctrl+Q")
-        
-        # Menú Editar
-        edit_menu = menubar.addMenu("✏️ Editar")
-        
-        refresh_action = edit_menu.addAction("Actualizar Lista")
-        refresh_action.triggered.connect(self.refresh_vm_list)
-        refresh_action.setShortcut("F5")
-        
-        edit_menu.addSeparator()
-        
-        import_vm_action = edit_menu.addAction("📥 Importar VM")
-        import_vm_action.triggered.connect(self.import_vm)
-        
-        export_vm_action = edit_menu.addAction("📤 Exportar VM")
-        export_vm_action.triggered.connect(self.export_vm)
-        
-        # Menú Herramientas
-        tools_menu = menubar.addMenu("🔧 Herramientas")
-        
-        disk_manager_action = tools_menu.addAction("💾 Administrador de Discos")
-        disk_manager_action.triggered.connect(self.open_disk_manager)
-        
-        network_action = tools_menu.addAction("🌐 Administrador de Redes")
-        network_action.triggered.connect(self.open_network_dialog)
-        
-        video_action = tools_menu.addAction("🎬 Configuración de Video")
-        video_action.triggered.connect(self.open_video_dialog)
-        
-        peripherals_action = tools_menu.addAction("🖨️ Administrador de Periféricos")
-        peripherals_action.triggered.connect(self.open_peripherals_dialog)
-        
-        # NUEVO: Menú Configuración
-        settings_menu = menubar.addMenu("⚙️ Configuración")
-        
-        settings_action = settings_menu.addAction("Preferencias")
-        settings_action.triggered.connect(self.open_settings_dialog)
-        settings_action.setShortcut("Ctrl+,")
-        
-        # Menú Ayuda
-        help_menu = menubar.addMenu("❓ Ayuda")
-        
-        about_action = help_menu.addAction("📋 Acerca de")
-        about_action.triggered.connect(self.show_about)
-        
-        help_action = help_menu.addAction("📖 Ayuda")
-        help_action.triggered.connect(self.show_help)
+        for label, entries in _MENU_SPEC:
+            menu = menubar.addMenu(label)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, slot, shortcut = entry
+                action = menu.addAction(text)
+                action.triggered.connect(getattr(self, slot))
+                if shortcut:
+                    action.setShortcut(shortcut)
     
     def open_settings_dialog(self):
         """Abre el diálogo de configuración"""
-        print("[DEBUG] Intentando abrir settings_dialog...")
+        logger.debug("Abriendo diálogo de configuración")
         try:
+            # Siempre nuevo: debe reflejar la configuración actual y no
+            # conservar cambios de una edición cancelada
+            from qemu_ui.dialogs import SettingsDialog
             dialog = SettingsDialog(self)
-            print("[DEBUG] Dialog creado, mostrando...")
             dialog.exec_()
         except ImportError as e:
-            print(f"[ERROR ImportError] {e}")
-            QMessageBox.warning(self, "Error", f"No se pudo cargar: {e}")
+            logger.error("No se pudo importar SettingsDialog: %s", e)
+            self._notify("warning", f"No se pudo cargar: {e}", "Error")
         except Exception as e:
-            print(f"[ERROR Exception] {e}")
-            QMessageBox.critical(self, "Error", f"Error: {e}")
+            logger.exception("Error abriendo SettingsDialog: %s", e)
+            self._notify("error", f"Error: {e}")
 
     def create_left_panel(self):
         """Crea panel izquierdo con lista de VMs"""
@@ -305,6 +453,10 @@ class QEMUManagerUI(QMainWindow):
         layout.addWidget(self.info_label)
         
         self.vm_list = QListWidget()
+        self.vm_list.setUniformItemSizes(True)
+        # Con listas largas el primer cuadro se pinta antes de terminar el layout
+        self.vm_list.setLayoutMode(QListView.Batched)
+        self.vm_list.setBatchSize(_LIST_BATCH_SIZE)
         self.vm_list.itemClicked.connect(self.on_vm_selected)
         layout.addWidget(self.vm_list)
         
@@ -362,21 +514,21 @@ class QEMUManagerUI(QMainWindow):
         """Crea panel derecho con pestañas de configuración"""
         self.tabs = QTabWidget()
         
-        # Pestaña Configuración General
-        config_tab = self.create_config_tab()
-        self.tabs.addTab(config_tab, "Configuración")
-        
-        # Pestaña Hardware
-        hardware_tab = self.create_hardware_tab()
-        self.tabs.addTab(hardware_tab, "Hardware")
-        
-        # Pestaña Red
-        network_tab = self.create_network_tab()
-        self.tabs.addTab(network_tab, "Red")
+        # Construir todas las pestañas primero y agregarlas con el repintado
+        # congelado: una sola invalidación en lugar de una por addTab
+        tabs = (
+            (self.create_config_tab(), "Configuración"),
+            (self.create_hardware_tab(), "Hardware"),
+            (self.create_network_tab(), "Red"),
+            (self.create_info_tab(), "Información"),
+        )
         
-        # Pestaña Información
-        info_tab = self.create_info_tab()
-        self.tabs.addTab(info_tab, "Información")
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            for tab, label in tabs:
+                self.tabs.addTab(tab, label)
+        finally:
+            self.tabs.setUpdatesEnabled(True)
         
         return self.tabs
     
@@ -479,6 +631,8 @@ class QEMUManagerUI(QMainWindow):
         
         self.info_text = QTextEdit()
         self.info_text.setReadOnly(True)
+        # Solo lectura: el historial de deshacer de cada setHtml no sirve
+        self.info_text.document().setUndoRedoEnabled(False)
         layout.addWidget(self.info_text)
         
         widget.setLayout(layout)
@@ -494,131 +648,96 @@ class QEMUManagerUI(QMainWindow):
         """Actualiza la lista de VMs usando presentador"""
         try:
             vms = self.vm_use_case.get_all_vms()
-            list_presenter = VMListPresenter(self.vm_list, self.info_label)
-            list_presenter.present_vms(vms, self.running_vms)
+            self._list_presenter.present_vms(vms, self.running_vms)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error cargando VMs: {e}")
+            self._notify("error", f"Error cargando VMs: {e}")
+    
+    def _selected_vm_name(self):
+        """Nombre de la VM seleccionada en la lista, o None"""
+        item = self.vm_list.currentItem()
+        return item.data(Qt.UserRole) if item else None
     
     def on_vm_selected(self, item):
         """Carga la configuración de una VM seleccionada"""
-        vm_name = item.text().replace("📦 ", "").replace("⚙️ ", "").replace(" (detectada)", "").replace(" [EJECUTANDO]", "")
-        vm_name = vm_name.split("[")[0].strip()
+        vm_name = item.data(Qt.UserRole)
 
         try:
             vm = self.vm_use_case.get_vm(vm_name)
             if vm:
-                self.name_input.setText(vm.name)
-                self.iso_path.setText(vm.iso or "")
-                self.disk_path.setText(vm.disk)
-                self.cpu_cores.setValue(vm.cpus)
-                self.ram_size.setValue(vm.ram)
-                self.os_type.setCurrentText(vm.os)
-                self.vga_type.setCurrentText(getattr(vm, 'vga', 'qxl'))
-                self.boot_order.setCurrentText(getattr(vm, 'boot_order', 'Disco duro (para arrancar SO)'))
-
-                if vm.auto_detected:
-                    self.auto_detect_label.setText("✓ Auto-detectada del sistema")
-                else:
-                    self.auto_detect_label.setText("✓ Configuración manual")
+                self._form_presenter.present_vm(vm)
 
                 # Show VM info
-                info_presenter = InfoPanelPresenter(self.info_text)
-                info_presenter.present_vm_info(vm, self.running_vms, self.storage)
+                self._info_presenter.present_vm_info(vm, self.running_vms, self.storage)
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error cargando VM: {e}")
+            self._notify("warning", f"Error cargando VM: {e}", "Error")
 
     def new_vm(self):
         """Crea una nueva VM"""
-        self.name_input.clear()
-        self.iso_path.clear()
-        self.disk_path.clear()
-        self.cpu_cores.setValue(2)
-        self.ram_size.setValue(1024)
-        self.vga_type.setCurrentText("qxl")
-        self.boot_order.setCurrentText("Disco duro (para arrancar SO)")
-        self.auto_detect_label.setText("")
+        self._form_presenter.clear_form()
         self.vm_list.clearSelection()
     
     def save_config(self):
         """Guarda configuración de VM"""
-        form_widgets = {
-            'name': self.name_input,
-            'iso': self.iso_path,
-            'disk': self.disk_path,
-            'cpus': self.cpu_cores,
-            'ram': self.ram_size,
-            'os': self.os_type,
-            'status': self.auto_detect_label
-        }
-        presenter = ConfigFormPresenter(form_widgets)
-        vm_data = presenter.get_vm_data()
-        
-        if not vm_data['name']:
-            QMessageBox.warning(self, "Error", "Ingrese un nombre para la VM")
+        name = self.name_input.text().strip()
+        if not name:
+            self._notify("warning", "Ingrese un nombre para la VM", "Error")
             return
         
         try:
-            vm = self.vm_use_case.create_vm(
-                name=vm_data['name'],
-                disk=vm_data['disk'],
-                iso=vm_data['iso'],
-                cpus=vm_data['cpus'],
-                ram=vm_data['ram'],
-                os=vm_data['os']
+            # Lectura directa de los widgets: boot order y VGA van en la misma
+            # llamada, sin un segundo guardado
+            self.vm_use_case.create_vm(
+                name=name,
+                disk=self.disk_path.text(),
+                iso=self.iso_path.text(),
+                cpus=self.cpu_cores.value(),
+                ram=self.ram_size.value(),
+                os=self.os_type.currentText(),
+                vga=self.vga_type.currentText(),
+                boot_order=self.boot_order.currentText()
             )
             
-            # NUEVO: Guardar boot order en VM
-            vm.boot_order = self.boot_order.currentText()
-            vm.vga = self.vga_type.currentText()
-            
-            # Guardar la VM actualizada
-            self.vm_use_case.update_vm(vm)
-            
             self.refresh_vm_list()
-            QMessageBox.information(self, "Éxito", f"VM '{vm_data['name']}' guardada")
+            self._notify("success", f"VM '{name}' guardada")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error guardando VM: {e}")
+            self._notify("error", f"Error guardando VM: {e}")
     
     def start_vm(self):
         """Inicia VM seleccionada"""
-        item = self.vm_list.currentItem()
-        if not item:
-            QMessageBox.warning(self, "Error", "Seleccione una VM")
+        vm_name = self._selected_vm_name()
+        if not vm_name:
+            self._notify("warning", "Seleccione una VM", "Error")
             return
         
-        vm_name = item.text().replace("📦 ", "").replace("⚙️ ", "").replace(" (detectada)", "").split("[")[0].strip()
-        
         try:
             vm = self.vm_use_case.get_vm(vm_name)
             if not vm:
-                QMessageBox.warning(self, "Error", "VM no encontrada")
+                self._notify("warning", "VM no encontrada", "Error")
                 return
             
             if vm_name in self.running_vms:
-                QMessageBox.warning(self, "Advertencia", f"La VM '{vm_name}' ya está en ejecución")
+                self._notify("warning", f"La VM '{vm_name}' ya está en ejecución")
                 return
 
             if self.qemu_executor.start_vm(vm):
                 self.running_vms[vm_name] = True
                 self.refresh_vm_list()
-                QMessageBox.information(self, "Éxito", f"VM '{vm_name}' iniciada")
+                self._notify("success", f"VM '{vm_name}' iniciada")
             else:
-                QMessageBox.critical(self, "Error", "No se pudo iniciar la VM")
+                self._notify("error", "No se pudo iniciar la VM")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error iniciando VM: {e}")
+            self._notify("error", f"Error iniciando VM: {e}")
 
     def restart_vm(self):
         """Reinicia VM seleccionada (detiene y vuelve a iniciar)"""
-        item = self.vm_list.currentItem()
-        if not item:
-            QMessageBox.warning(self, "Error", "Seleccione una VM")
+        vm_name = self._selected_vm_name()
+        if not vm_name:
+            self._notify("warning", "Seleccione una VM", "Error")
             return
         
-        vm_name = item.text().replace("📦 ", "").replace("⚙️ ", "").replace(" (detectada)", "").split("[")[0].strip()
-        
         try:
             if vm_name not in self.running_vms:
-                QMessageBox.warning(self, "Advertencia", f"La VM '{vm_name}' no está en ejecución")
+                self._notify("warning", f"La VM '{vm_name}' no está en ejecución")
                 return
             
             # Detener VM
@@ -626,45 +745,44 @@ class QEMUManagerUI(QMainWindow):
                 del self.running_vms[vm_name]
                 self.refresh_vm_list()
                 
-                # Pequeña pausa para asegurar que se detuvo
-                from time import sleep
-                sleep(1)
-                
-                # Volver a iniciar
-                vm = self.vm_use_case.get_vm(vm_name)
-                if vm and self.qemu_executor.start_vm(vm):
-                    self.running_vms[vm_name] = True
-                    self.refresh_vm_list()
-                    QMessageBox.information(self, "Éxito", f"VM '{vm_name}' reiniciada")
-                else:
-                    QMessageBox.critical(self, "Error", "No se pudo reiniciar la VM")
+                # Pequeña pausa antes de relanzar, sin bloquear la interfaz
+                QTimer.singleShot(_RESTART_DELAY_MS, lambda: self._finish_restart(vm_name))
             else:
-                QMessageBox.critical(self, "Error", "No se pudo detener la VM para reiniciarla")
+                self._notify("error", "No se pudo detener la VM para reiniciarla")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error reiniciando VM: {e}")
+            self._notify("error", f"Error reiniciando VM: {e}")
+    
+    def _finish_restart(self, vm_name):
+        """Segunda mitad de restart_vm: vuelve a iniciar la VM detenida"""
+        # Durante la pausa el usuario pudo iniciarla: no lanzar un segundo
+        # QEMU sobre el mismo disco
+        if vm_name in self.running_vms:
+            return
+        
+        try:
+            vm = self.vm_use_case.get_vm(vm_name)
+            if vm and self.qemu_executor.start_vm(vm):
+                self.running_vms[vm_name] = True
+                self.refresh_vm_list()
+                self._notify("success", f"VM '{vm_name}' reiniciada")
+            else:
+                self._notify("error", "No se pudo reiniciar la VM")
+        except Exception as e:
+            self._notify("error", f"Error reiniciando VM: {e}")
     
     def shutdown_vm(self):
         """Apaga VM seleccionada (envía señal de apagado graceful)"""
-        item = self.vm_list.currentItem()
-        if not item:
-            QMessageBox.warning(self, "Error", "Seleccione una VM")
+        vm_name = self._selected_vm_name()
+        if not vm_name:
+            self._notify("warning", "Seleccione una VM", "Error")
             return
         
-        vm_name = item.text().replace("📦 ", "").replace("⚙️ ", "").replace(" (detectada)", "").split("[")[0].strip()
-        
         try:
             if vm_name not in self.running_vms:
-                QMessageBox.warning(self, "Advertencia", f"La VM '{vm_name}' no está en ejecución")
+                self._notify("warning", f"La VM '{vm_name}' no está en ejecución")
                 return
             
-            reply = QMessageBox.question(
-                self,
-                "Confirmar apagado",
-                f"¿Apagar la VM '{vm_name}'?",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
+            if self._confirm("Confirmar apagado", f"¿Apagar la VM '{vm_name}'?"):
                 # Intentar apagado graceful primero (ACPI shutdown)
                 import subprocess
                 shutdown_cmd = f'echo quit | nc localhost 5900'  # Para QEMU Monitor si está habilitado
@@ -673,134 +791,162 @@ class QEMUManagerUI(QMainWindow):
                 if self.qemu_executor.stop_vm(vm_name):
                     del self.running_vms[vm_name]
                     self.refresh_vm_list()
-                    QMessageBox.information(self, "Éxito", f"VM '{vm_name}' apagada")
+                    self._notify("success", f"VM '{vm_name}' apagada")
                 else:
-                    QMessageBox.critical(self, "Error", "No se pudo apagar la VM")
+                    self._notify("error", "No se pudo apagar la VM")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error apagando VM: {e}")
+            self._notify("error", f"Error apagando VM: {e}")
 
     def stop_vm(self):
         """Detiene VM seleccionada"""
-        item = self.vm_list.currentItem()
-        if not item:
+        vm_name = self._selected_vm_name()
+        if not vm_name:
             return
         
-        vm_name = item.text().replace("📦 ", "").replace("⚙️ ", "").replace(" (detectada)", "").split("[")[0].strip()
-        
         try:
             if vm_name in self.running_vms:
                 if self.qemu_executor.stop_vm(vm_name):
                     del self.running_vms[vm_name]
                     self.refresh_vm_list()
-                    QMessageBox.information(self, "Éxito", f"VM '{vm_name}' detenida")
+                    self._notify("success", f"VM '{vm_name}' detenida")
             else:
-                QMessageBox.warning(self, "Advertencia", f"La VM '{vm_name}' no está en ejecución")
+                self._notify("warning", f"La VM '{vm_name}' no está en ejecución")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error deteniendo VM: {e}")
+            self._notify("error", f"Error deteniendo VM: {e}")
     
     def delete_vm(self):
         """Elimina VM seleccionada"""
-        item = self.vm_list.currentItem()
-        if not item:
+        vm_name = self._selected_vm_name()
+        if not vm_name:
             return
         
-        vm_name = item.text().replace("📦 ", "").replace("⚙️ ", "").replace(" (detectada)", "").split("[")[0].strip()
-        
-        reply = QMessageBox.question(
-            self,
+        if self._confirm(
             "Confirmar",
-            f"¿Eliminar la VM '{vm_name}'?\n(No se eliminarán los archivos de disco)",
-            QMessageBox.Yes | QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+            f"¿Eliminar la VM '{vm_name}'?\n(No se eliminarán los archivos de disco)"
+        ):
             try:
                 self.vm_use_case.delete_vm(vm_name)
                 self.refresh_vm_list()
-                QMessageBox.information(self, "Éxito", "VM eliminada")
+                self._notify("success", "VM eliminada")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error eliminando VM: {e}")
+                self._notify("error", f"Error eliminando VM: {e}")
     
-    def update_vm_status(self):
-        """Actualiza estado de VMs en ejecución"""
-        dead_vms = [name for name in self.running_vms if not self.qemu_executor.running_processes.get(name)]
-        for vm_name in dead_vms:
-            del self.running_vms[vm_name]
-            self.refresh_vm_list()
+    def _on_vm_exited(self, vm_name):
+        """Marca como detenida una VM cuyo proceso terminó"""
+        if self.running_vms.pop(vm_name, None) is not None:
+            self._list_presenter.present_running_state(vm_name, False)
     
     def browse_iso(self):
         """Abre diálogo para seleccionar ISO"""
-        path, _ = QFileDialog.getOpenFileName(self, "Seleccionar ISO", "", "ISO Files (*.iso)")
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Seleccionar ISO", self._last_iso_dir, "ISO Files (*.iso)",
+            options=QFileDialog.ReadOnly | QFileDialog.DontResolveSymlinks
+        )
         if path:
             self.iso_path.setText(path)
+            self._last_iso_dir = os.path.dirname(path)
     
     def browse_disk(self):
         """Abre diálogo para seleccionar disco"""
-        path, _ = QFileDialog.getSaveFileName(self, "Seleccionar Disco", "", "QEMU Image (*.qcow2)")
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Seleccionar Disco", self._last_disk_dir, "QEMU Image (*.qcow2)",
+            options=QFileDialog.DontResolveSymlinks
+        )
         if path:
             self.disk_path.setText(path)
+            self._last_disk_dir = os.path.dirname(path)
+    
+    # ==================== MENSAJES ====================
+    
+    def _message_box(self):
+        """QMessageBox compartido; uno temporal si el compartido está abierto"""
+        if self._msg is None:
+            self._msg = QMessageBox(self)
+        elif self._msg.isVisible():
+            # p. ej. un timer que notifica mientras otro mensaje sigue abierto
+            return QMessageBox(self)
+        return self._msg
+    
+    def _notify(self, kind, text, title=None):
+        """Muestra un mensaje modal; kind es 'success', 'warning' o 'error'"""
+        icon, default_title = _NOTIFY_KINDS[kind]
+        box = self._message_box()
+        box.setIcon(icon)
+        box.setWindowTitle(title or default_title)
+        box.setText(text)
+        box.setStandardButtons(QMessageBox.Ok)
+        box.exec_()
+    
+    def _confirm(self, title, text):
+        """Pregunta Sí/No; devuelve True si se eligió Sí"""
+        box = self._message_box()
+        box.setIcon(QMessageBox.Question)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        return box.exec_() == QMessageBox.Yes
     
     # ==================== DIÁLOGOS ====================
     
     def open_disk_manager(self):
         """Abre gestor de discos"""
-        dialog = DiskManagerDialog(self, self.storage)
-        dialog.exec_()
+        if self._disk_dialog is None:
+            from qemu_ui.dialogs import DiskManagerDialog
+            self._disk_dialog = DiskManagerDialog(self, self.storage)
+        self._disk_dialog.exec_()
     
     def open_network_dialog(self):
         """Abre gestor de redes"""
-        dialog = NetworkDialog(self)
-        dialog.exec_()
+        if self._network_dialog is None:
+            from qemu_ui.dialogs import NetworkDialog
+            self._network_dialog = NetworkDialog(self)
+        self._network_dialog.exec_()
     
     def open_video_dialog(self):
         """Abre configurador de video"""
-        dialog = VideoDialog(self)
-        dialog.exec_()
+        if self._video_dialog is None:
+            from qemu_ui.dialogs import VideoDialog
+            self._video_dialog = VideoDialog(self)
+        self._video_dialog.exec_()
     
     def open_peripherals_dialog(self):
         """Abre gestor de periféricos"""
-        dialog = PeripheralsDialog(self)
-        dialog.exec_()
+        if self._peripherals_dialog is None:
+            from qemu_ui.dialogs import PeripheralsDialog
+            self._peripherals_dialog = PeripheralsDialog(self)
+        self._peripherals_dialog.exec_()
     
     def open_search_dialog(self):
         """Abre diálogo de búsqueda"""
-        dialog = SearchDialog(self, self.storage)
-        dialog.exec_()
+        if self._search_dialog is None:
+            from qemu_ui.dialogs import SearchDialog
+            self._search_dialog = SearchDialog(self, self.storage)
+        self._search_dialog.exec_()
     
     def show_about(self):
         """Muestra diálogo About"""
-        dialog = AboutDialog(self)
-        dialog.exec_()
+        if self._about_dialog is None:
+            from qemu_ui.dialogs import AboutDialog
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec_()
     
     def show_help(self):
         """Muestra ayuda"""
-        help_text = """
-        <b>QEMU Manager - Ayuda</b><br><br>
-        
-        <b>Funcionalidades:</b><br>
-        • <b>Nueva VM:</b> Crear una nueva máquina virtual<br>
-        • <b>Buscar:</b> Buscar discos e imágenes existentes<br>
-        • <b>Importar:</b> Importar discos existentes<br>
-        • <b>Iniciar/Detener:</b> Controlar máquinas virtuales<br><br>
-        
-        <b>Atajos de teclado:</b><br>
-        • Ctrl+N: Nueva VM<br>
-        • Ctrl+F: Buscar<br>
-        • Ctrl+O: Cargar configuración<br>
-        • Ctrl+S: Guardar configuración<br>
-        • F5: Actualizar lista<br>
-        • Ctrl+Q: Salir<br>
-        """
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Ayuda")
         dialog.setGeometry(200, 200, 600, 400)
         layout = QVBoxLayout()
         
-        text = QTextEdit()
-        text.setHtml(help_text)
-        text.setReadOnly(True)
-        layout.addWidget(text)
+        # Contenido estático y pequeño: un QLabel evita crear un QTextDocument
+        text = QLabel(_HELP_HTML)
+        text.setTextFormat(Qt.RichText)
+        text.setWordWrap(True)
+        text.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(text)
+        layout.addWidget(scroll)
         
         close_btn = QPushButton("Cerrar")
         close_btn.clicked.connect(dialog.close)
@@ -815,7 +961,7 @@ class QEMUManagerUI(QMainWindow):
             self, "Cargar Configuración", "", "JSON Files (*.json)"
         )
         if path:
-            QMessageBox.information(self, "Éxito", "Configuración cargada")
+            self._notify("success", "Configuración cargada")
     
     def save_all_configs(self):
         """Guarda todas las configuraciones"""
@@ -823,7 +969,7 @@ class QEMUManagerUI(QMainWindow):
             self, "Guardar Configuración", "qemu_config.json", "JSON Files (*.json)"
         )
         if path:
-            QMessageBox.information(self, "Éxito", "Configuración guardada")
+            self._notify("success", "Configuración guardada")
     
     def import_vm(self):
         """Importa VM desde archivo"""
@@ -831,7 +977,7 @@ class QEMUManagerUI(QMainWindow):
             self, "Importar VM", "", "QEMU Image (*.qcow2)"
         )
         if path:
-            QMessageBox.information(self, "Éxito", "VM importada")
+            self._notify("success", "VM importada")
     
     def export_vm(self):
         """Exporta VM a archivo"""
@@ -839,85 +985,81 @@ class QEMUManagerUI(QMainWindow):
             self, "Exportar VM", "vm_config.json", "JSON Files (*.json)"
         )
         if path:
-            QMessageBox.information(self, "Éxito", "VM exportada")
+            self._notify("success", "VM exportada")
     
     def detect_running_vms(self):
-        """Detecta VMs que siguen en ejecución desde sesiones anteriores"""
+        """
+        Detecta VMs que siguen en ejecución desde sesiones anteriores
+        
+        Retorna la instantánea [(pid, cmdline), ...] de procesos QEMU (vacía
+        si no hay ninguno) para que quien llama la reutilice.
+        """
         try:
-            import subprocess
-            import re
-            
-            # Buscar procesos qemu-system-x86_64 en ejecución
-            if sys.platform == 'win32':
-                # Windows: usar tasklist
-                result = subprocess.run(
-                    'tasklist /FI "IMAGENAME eq qemu-system-x86_64.exe"',
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                # Si encuentra procesos, hay VMs ejecutándose
-                if 'qemu-system-x86_64.exe' in result.stdout:
-                    print("[WARN] Se detectaron VMs en ejecución desde sesión anterior")
-                    return True
-            else:
-                # Linux/Mac: usar ps
-                result = subprocess.run(
-                    'ps aux | grep qemu-system-x86_64',
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                if 'qemu-system-x86_64' in result.stdout and 'grep' not in result.stdout:
-                    print("[WARN] Se detectaron VMs en ejecución desde sesión anterior")
-                    return True
-            
-            return False
+            # Una sola enumeración de procesos, sin lanzar ps/tasklist
+            snapshot = list(iter_qemu_processes())
+            if snapshot:
+                print("[WARN] Se detectaron VMs en ejecución desde sesión anterior")
+            return snapshot
         except Exception as e:
             print(f"[WARN] Error detectando VMs en ejecución: {e}")
-            return False
+            return []
     
     def handle_orphaned_vms(self):
         """Maneja VMs huérfanas detectadas"""
-        if self.detect_running_vms():
-            reply = QMessageBox.question(
-                self,
+        snapshot = self.detect_running_vms()
+        if snapshot:
+            monitor = self._confirm(
                 "VMs en ejecución detectadas",
                 "Se detectaron máquinas virtuales en ejecución desde una sesión anterior.\n\n"
                 "¿Qué deseas hacer?\n\n"
                 "Sí: Monitorear VMs existentes\n"
-                "No: Terminar todas las VMs de QEMU",
-                QMessageBox.Yes | QMessageBox.No
+                "No: Terminar todas las VMs de QEMU"
             )
             
-            if reply == QMessageBox.No:
+            if not monitor:
                 # Terminar todas las VMs
-                self.kill_all_qemu_processes()
+                self.kill_all_qemu_processes(snapshot)
             else:
-                # Sincronizar estado - marcar como ejecutándose
-                self.sync_running_vms_state()
+                # Sincronizar estado con la misma instantánea de la detección
+                self.sync_running_vms_state(snapshot)
     
-    def sync_running_vms_state(self):
-        """Sincroniza el estado de las VMs con la realidad"""
+    def sync_running_vms_state(self, snapshot=None):
+        """
+        Sincroniza el estado de las VMs con la realidad
+        
+        snapshot es la lista [(pid, cmdline), ...] de detect_running_vms; si
+        no se da, se enumeran los procesos una vez.
+        """
         try:
-            import subprocess
-            
             # Obtener lista de VMs
             vms = self.vm_use_case.get_all_vms()
             
+            # Una sola enumeración de procesos en lugar de un ps/tasklist por VM
+            if snapshot is None:
+                snapshot = list(iter_qemu_processes())
+            cmdlines = [cmdline for _, cmdline in snapshot]
+            
+            # Una alternación compilada con todos los nombres (los más largos
+            # primero) recorre cada cmdline una sola vez. Se ancla al argumento
+            # "-name <vm>" y distingue mayúsculas: un nombre dentro de la ruta
+            # de un disco, o "Win" frente a "win", no cuentan como la VM
+            running_names = set()
+            if vms and cmdlines:
+                alternatives = sorted({vm.name for vm in vms}, key=len, reverse=True)
+                pattern = re.compile(
+                    r'(?:^|\s)-name\s+(' + '|'.join(map(re.escape, alternatives)) + r')(?=[\s,]|$)'
+                )
+                for line in cmdlines:
+                    running_names.update(pattern.findall(line))
+            
             for vm in vms:
                 # Buscar si la VM está en ejecución
-                if sys.platform == 'win32':
-                    cmd = f'tasklist | find /I "{vm.name}"'
-                else:
-                    cmd = f'ps aux | grep -i "{vm.name}" | grep -v grep'
-                
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                running = vm.name in running_names
                 
-                if result.stdout and vm.name not in self.running_vms:
+                if running and vm.name not in self.running_vms:
                     print(f"[INFO] VM detectada en ejecución: {vm.name}")
                     self.running_vms[vm.name] = True
-                elif not result.stdout and vm.name in self.running_vms:
+                elif not running and vm.name in self.running_vms:
                     print(f"[INFO] VM no está ejecutándose: {vm.name}")
                     del self.running_vms[vm.name]
             
@@ -925,33 +1067,38 @@ class QEMUManagerUI(QMainWindow):
         except Exception as e:
             print(f"[WARN] Error sincronizando estado: {e}")
     
-    def kill_all_qemu_processes(self):
+    def kill_all_qemu_processes(self, snapshot=None):
         """Termina todos los procesos QEMU en ejecución"""
         try:
-            if sys.platform == 'win32':
-                subprocess.run('taskkill /IM qemu-system-x86_64.exe /F', shell=True)
-            else:
-                subprocess.run('pkill -f qemu-system-x86_64', shell=True)
+            # SIGTERM directo a cada PID, espera acotada y SIGKILL a los que
+            # sigan vivos; sin lanzar taskkill/pkill por shell
+            pids = None if snapshot is None else [pid for pid, _ in snapshot]
+            _, failed = terminate_qemu_processes(pids)
             
-            QMessageBox.information(
-                self,
-                "Éxito",
-                "Todos los procesos QEMU han sido terminados"
-            )
-            self.running_vms.clear()
-            self.refresh_vm_list()
+            if failed:
+                self._notify(
+                    "warning",
+                    f"No se pudieron terminar {len(failed)} proceso(s) QEMU "
+                    f"(PID {', '.join(map(str, failed))}): permiso denegado",
+                    "Error"
+                )
+                # Los que siguen vivos se vuelven a detectar
+                self.sync_running_vms_state()
+            else:
+                self._notify("success", "Todos los procesos QEMU han sido terminados")
+                self.running_vms.clear()
+                self.refresh_vm_list()
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error terminando procesos: {e}")
+            self._notify("warning", f"Error terminando procesos: {e}", "Error")
 
 
     def closeEvent(self, event):
         """Maneja cierre de la aplicación"""
-        # Detener todas las VMs
-        for vm_name in list(self.running_vms.keys()):
-            try:
-                self.qemu_executor.stop_vm(vm_name)
-            except:
-                pass
+        # Detener todas las VMs: SIGTERM a la vez y una espera acotada común
+        try:
+            self.qemu_executor.stop_all()
+        except Exception as e:
+            print(f"[WARN] Error deteniendo VMs al cerrar: {e}")
         
         event.accept()
 
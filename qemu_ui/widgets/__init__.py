@@ -5,9 +5,11 @@ Paquete de widgets personalizados
 """
 
 from .loading_indicator import LoadingSpinner, LoadingDialog, LoadingOverlay
+from .lazy_tab_widget import LazyTabWidget
 
 __all__ = [
     'LoadingSpinner',
     'LoadingDialog',
     'LoadingOverlay',
+    'LazyTabWidget',
 ]
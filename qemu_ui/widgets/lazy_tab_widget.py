@@ -0,0 +1,56 @@
+# qemu_ui/widgets/lazy_tab_widget.py
+"""
+QTabWidget con construcción diferida de pestañas
+"""
+
+from PyQt5.QtWidgets import QTabWidget, QWidget
+from PyQt5.QtCore import QSignalBlocker
+
+
+class LazyTabWidget(QTabWidget):
+    """
+    QTabWidget que construye cada pestaña la primera vez que se muestra
+
+    Cada pestaña se registra con una función que devuelve su widget; hasta
+    que se selecciona, en su lugar hay un QWidget vacío. La pestaña visible
+    al registrarse (la primera) se construye de inmediato.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._builders = {}
+        self.currentChanged.connect(self.ensure_built)
+
+    def add_lazy_tab(self, builder, label):
+        """Agrega una pestaña cuyo contenido se crea con builder() al mostrarse"""
+        index = self.addTab(QWidget(), label)
+        self._builders[index] = builder
+        if index == self.currentIndex():
+            self.ensure_built(index)
+        return index
+
+    def ensure_built(self, index):
+        """Sustituye el marcador de la pestaña por su contenido real"""
+        builder = self._builders.pop(index, None)
+        if builder is None:
+            return
+
+        real_tab = builder()
+
+        # El intercambio no debe notificarse como cambio de pestaña
+        blocker = QSignalBlocker(self)
+        try:
+            placeholder = self.widget(index)
+            label = self.tabText(index)
+            current = self.currentIndex()
+            self.removeTab(index)
+            self.insertTab(index, real_tab, label)
+            self.setCurrentIndex(current)
+        finally:
+            blocker.unblock()
+        placeholder.deleteLater()
+
+    def ensure_all_built(self):
+        """Construye todas las pestañas pendientes"""
+        for index in list(self._builders):
+            self.ensure_built(index)
@@ -5,65 +5,157 @@ Widget de indicador de carga animado
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt5.QtCore import QTimer, Qt, QSize
-from PyQt5.QtGui import QFont, QColor, QPainter, QPen
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QPixmap
 import math
+from functools import partial
+
+
+def _spoke_pen(index):
+    """Pen de un radio: mismo azul con opacidad decreciente"""
+    opacity = int(255 * (1 - index / 12))
+    pen = QPen(QColor(0, 120, 215, opacity))
+    pen.setWidth(2)
+    pen.setCapStyle(Qt.RoundCap)
+    return pen
+
+
+# Pens de los 12 radios, compartidos por todos los spinners
+_SPOKE_PENS = tuple(_spoke_pen(i) for i in range(12))
 
 
 class LoadingSpinner(QWidget):
     """Spinner animado de carga"""
     
-    def __init__(self, parent=None, size=50, speed=100):
+    # Un QTimer por intervalo compartido por todos los spinners que lo usan:
+    # {speed: (timer, {id de cada spinner suscrito})}. Solo corre si hay
+    # alguno suscrito.
+    _shared_timers = {}
+    
+    def __init__(self, parent=None, size=50, speed=100, step=6):
         super().__init__(parent)
         self.size = size
         self.angle = 0
         self.speed = speed
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.rotate)
+        self.step = step
+        self._subscribed = False
         
         self.setFixedSize(size, size)
-        self.timer.start(self.speed)
+        
+        # hideEvent no llega si se destruye estando visible (p. ej. al borrar
+        # su padre): destroyed lo da de baja igualmente. partial no guarda
+        # referencia al spinner, que ya se está destruyendo
+        self.destroyed.connect(partial(LoadingSpinner._release, speed, id(self)))
+        
+        # Los 12 radios son iguales en cada cuadro salvo por la rotación:
+        # se dibujan una vez y cada cuadro solo rota la imagen. Se crea al
+        # pintar, cuando el widget ya está en su pantalla y devicePixelRatioF()
+        # es el real, y se rehace si cambia (p. ej. al pasar a otro monitor)
+        self._frame = None
+        self._frame_ratio = None
+    
+    def _subscribe(self):
+        """Conecta el spinner al timer compartido de su intervalo"""
+        if self._subscribed:
+            return
+        entry = LoadingSpinner._shared_timers.get(self.speed)
+        if entry is None:
+            timer = QTimer()
+            # Un spinner no necesita precisión: Qt puede agrupar el despertar
+            timer.setTimerType(Qt.CoarseTimer)
+            entry = (timer, set())
+            LoadingSpinner._shared_timers[self.speed] = entry
+        timer, subscribers = entry
+        timer.timeout.connect(self.rotate)
+        subscribers.add(id(self))
+        if not timer.isActive():
+            timer.start(self.speed)
+        self._subscribed = True
+    
+    def _unsubscribe(self):
+        """Desconecta el spinner; el timer se detiene sin suscriptores"""
+        if not self._subscribed:
+            return
+        LoadingSpinner._shared_timers[self.speed][0].timeout.disconnect(self.rotate)
+        LoadingSpinner._release(self.speed, id(self))
+        self._subscribed = False
+    
+    @staticmethod
+    def _release(speed, spinner_id, *_):
+        """Quita un spinner de los suscriptores del timer y lo para si queda vacío"""
+        entry = LoadingSpinner._shared_timers.get(speed)
+        if entry is None:
+            return
+        timer, subscribers = entry
+        subscribers.discard(spinner_id)
+        if not subscribers:
+            timer.stop()
+    
+    def _render_frame(self, ratio):
+        """Dibuja los radios del spinner en un QPixmap transparente"""
+        frame = QPixmap(int(self.size * ratio), int(self.size * ratio))
+        frame.setDevicePixelRatio(ratio)
+        frame.fill(Qt.transparent)
+        
+        painter = QPainter(frame)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(self.size / 2, self.size / 2)
+        
+        # Color degradado
+        for i, pen in enumerate(_SPOKE_PENS):
+            painter.save()
+            painter.rotate(i * 30)
+            painter.setPen(pen)
+            
+            # Linea
+            painter.drawLine(0, self.size // 4, 0, self.size // 3)
+            painter.restore()
+        
+        painter.end()
+        return frame
+    
+    def showEvent(self, event):
+        """Arranca la animación al mostrarse"""
+        self._subscribe()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Detiene la animación al ocultarse: un spinner oculto no consume CPU"""
+        self._unsubscribe()
+        super().hideEvent(event)
     
     def rotate(self):
         """Rota el spinner"""
-        self.angle = (self.angle + 6) % 360
+        if not self.isVisible():
+            return
+        self.angle = (self.angle + self.step) % 360
         self.update()
     
     def paintEvent(self, event):
         """Dibuja el spinner"""
+        ratio = self.devicePixelRatioF()
+        if ratio != self._frame_ratio:
+            self._frame = self._render_frame(ratio)
+            self._frame_ratio = ratio
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
         
         # Centro
         center_x = self.width() / 2
         center_y = self.height() / 2
         
-        # Dibujar circulos
+        # Rotar el cuadro pre-dibujado alrededor del centro
         painter.translate(center_x, center_y)
         painter.rotate(self.angle)
-        
-        # Color degradado
-        for i in range(12):
-            painter.save()
-            painter.rotate(i * 30)
-            
-            # Opacidad decreciente
-            opacity = int(255 * (1 - i / 12))
-            pen = QPen(QColor(0, 120, 215, opacity))
-            pen.setWidth(2)
-            pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(pen)
-            
-            # Linea
-            painter.drawLine(0, self.size // 4, 0, self.size // 3)
-            painter.restore()
+        painter.drawPixmap(-self.size // 2, -self.size // 2, self._frame)
     
     def stop(self):
         """Detiene la animacion"""
-        self.timer.stop()
+        self._unsubscribe()
     
     def start(self):
         """Inicia la animacion"""
-        self.timer.start()
+        self._subscribe()
 
 
 class LoadingDialog(QWidget):
@@ -140,8 +232,9 @@ class LoadingOverlay(QWidget):
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignCenter)
         
-        # Spinner grande
-        self.spinner = LoadingSpinner(self, size=80, speed=50)
+        # Spinner grande: ~15 cuadros/s; 8° por cuadro mantiene la velocidad
+        # de giro de antes (6° cada 50 ms)
+        self.spinner = LoadingSpinner(self, size=80, speed=66, step=8)
         layout.addWidget(self.spinner, alignment=Qt.AlignCenter)
         
         # Mensaje
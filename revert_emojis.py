@@ -5,7 +5,9 @@ Ejecutar en la raíz del proyecto para deshacer los cambios de cleanup_emojis.py
 """
 
 import os
-from pathlib import Path
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 
 # Mapeo inverso de texto a emojis
 TEXT_TO_EMOJI_MAP = {
@@ -50,26 +52,57 @@ TEXT_TO_EMOJI_MAP = {
     '[UNCHECKED]': '☐',
 }
 
+# Mapa y alternación sobre bytes UTF-8: se opera sobre el archivo sin
+# decodificarlo
+BYTE_MAP = {
+    text.encode('utf-8'): emoji.encode('utf-8')
+    for text, emoji in TEXT_TO_EMOJI_MAP.items()
+}
+_MARKER_PATTERN_BYTES = re.compile(b'|'.join(re.escape(text) for text in BYTE_MAP))
+
+# Directorios que nunca contienen código del proyecto: se podan sin recorrerlos
+_SKIP_DIRS = frozenset({'venv', '.venv', '.git', '__pycache__', 'node_modules', 'dist', 'build'})
+
+# Búfer de escritura: el archivo completo sale en una sola llamada
+_WRITE_BUFFER = 1024 * 1024
+
+def walk_py(root):
+    """Genera las rutas de los .py bajo root sin entrar en _SKIP_DIRS"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+        except OSError:
+            continue
+
+def replace_markers(raw):
+    """Sustituye cada marca [TEXTO] por su emoji; retorna (bytes, reemplazos)"""
+    return _MARKER_PATTERN_BYTES.subn(lambda m: BYTE_MAP[m.group(0)], raw)
+
 def revert_file(filepath):
     """Revierte emojis en un archivo"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Reemplazar texto a emojis
-        # IMPORTANTE: Revertir en orden para evitar conflictos
-        # Primero los más específicos
-        replacements = sorted(TEXT_TO_EMOJI_MAP.items(), key=lambda x: -len(x[0]))
+        with open(filepath, 'rb') as f:
+            raw = f.read()
         
-        for text, emoji in replacements:
-            content = content.replace(text, emoji)
+        # Reemplazar texto a emojis en una sola pasada sobre los bytes; la
+        # mayoría de archivos no tiene marcas y sale sin copiar nada
+        content, replaced = replace_markers(raw)
         
         # Si hubo cambios, guardar
-        if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
+        if replaced:
+            # Escribir en un temporal y reemplazar: nunca queda un .py a medias
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'wb', buffering=_WRITE_BUFFER) as f:
                 f.write(content)
+            shutil.copymode(filepath, tmp_path)
+            os.replace(tmp_path, filepath)
             print(f"[REVERTED] {filepath}")
             return True
         
@@ -85,28 +118,32 @@ def main():
     print("=" * 60)
     print()
     
-    # Archivos a revertir
-    python_files = list(Path('.').rglob('*.py'))
+    # Archivos a revertir (venv, .git, etc. se podan durante el recorrido)
+    python_files = list(walk_py('.'))
     
-    reverted_count = 0
-    total_count = 0
     skipped_count = 0
+    pending = []
     
     for py_file in python_files:
-        # Ignorar venv y este script
-        if 'venv' in str(py_file) or py_file.name == 'revert_emojis.py':
+        # Ignorar este script
+        if os.path.basename(py_file) == 'revert_emojis.py':
             skipped_count += 1
             continue
         
-        total_count += 1
-        if revert_file(str(py_file)):
-            reverted_count += 1
+        pending.append(py_file)
+    
+    # Cada archivo es independiente: repartirlos entre procesos
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(revert_file, pending, chunksize=16))
+    
+    total_count = len(pending)
+    reverted_count = sum(results)
     
     print()
     print("=" * 60)
     print(f"Total de archivos procesados: {total_count}")
     print(f"Archivos revertidos: {reverted_count}")
-    print(f"Archivos omitidos (venv): {skipped_count}")
+    print(f"Archivos omitidos: {skipped_count}")
     print("=" * 60)
     print()
     print("[OK] Reversión completada")
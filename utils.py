@@ -10,27 +10,101 @@ Este módulo contiene funciones de utilidad compartidas por toda la aplicación
 
 import subprocess
 import logging
+import logging.handlers
+import atexit
+import binascii
+import queue
+import errno
 import json
+import mmap
 import os
 import sys
+import threading
+import time
+import uuid
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Iterator, Mapping
+from types import MappingProxyType
 from datetime import datetime
+from dataclasses import dataclass
 import re
 import shutil
+import functools
+import random
+from functools import lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice, repeat
 import psutil  # Para obtener información del sistema
 
+try:
+    import orjson  # Opcional: serialización JSON más rápida
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # Opcional: comparación vectorizada en compare_configs
+except ImportError:
+    np = None
+
 import config
 
 # ==================== CONFIGURACIÓN DE LOGGING ====================
 
+# Hilo que escribe los registros encolados; se detiene (y vacía la cola) al salir
+_log_listener = None
+
+# Búfer de los archivos de log y tiempo máximo entre vaciados
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 1.0
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler con búfer grande que no vacía el archivo en cada registro
+    
+    Se vacía como mucho una vez por _LOG_FLUSH_INTERVAL, siempre ante un
+    registro ERROR o superior, y al cerrar (logging.shutdown al salir).
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, delay=False):
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode, encoding, delay)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        
+        now = time.monotonic()
+        if record.levelno >= logging.ERROR or now - self._last_flush >= _LOG_FLUSH_INTERVAL:
+            self.flush()
+            self._last_flush = now
+
+
 def setup_logging():
     """
     Configura el sistema de logging de la aplicación
     
+    El logger solo encola los registros (QueueHandler); un QueueListener en
+    segundo plano los entrega a los handlers de archivo y consola, de modo
+    que quien registra no espera por la escritura en disco.
+    
     Retorna:
         logger: Logger configurado
     """
+    global _log_listener
+    
     # Crear directorio de logs si no existe
     config.LOGS_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -45,22 +119,31 @@ def setup_logging():
     )
     
     # Handler para archivo
-    file_handler = logging.FileHandler(config.MAIN_LOG_FILE)
+    file_handler = _BufferedFileHandler(config.MAIN_LOG_FILE)
     file_handler.setLevel(config.LOG_LEVEL)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # Handler para error
-    error_handler = logging.FileHandler(config.ERROR_LOG_FILE)
+    error_handler = _BufferedFileHandler(config.ERROR_LOG_FILE)
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    logger.addHandler(error_handler)
     
     # Handler para consola
     console_handler = logging.StreamHandler()
     console_handler.setLevel(config.LOG_LEVEL)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    
+    # Cola entre el logger y los handlers reales
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    # respect_handler_level: errors.log sigue recibiendo solo ERROR o superior
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, error_handler, console_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
     
     return logger
 
@@ -71,6 +154,11 @@ logger = setup_logging()
 
 # ==================== UTILIDADES DE SISTEMA ====================
 
+# Las comprobaciones de QEMU/KVM lanzan un proceso (o hacen stat) y su
+# resultado no cambia durante la ejecución: se memorizan con lru_cache.
+# Usar <función>.cache_clear() para forzar una nueva comprobación.
+
+@lru_cache(maxsize=1)
 def check_qemu_installed() -> bool:
     """
     Verifica si QEMU está instalado en el sistema
@@ -98,6 +186,7 @@ def check_qemu_installed() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def check_qemu_img_installed() -> bool:
     """
     Verifica si qemu-img está instalado
@@ -118,6 +207,7 @@ def check_qemu_img_installed() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def is_kvm_available() -> bool:
     """
     Verifica si KVM (aceleración de hardware) está disponible
@@ -138,6 +228,21 @@ def is_kvm_available() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, Any]:
+    """Datos de plataforma que no cambian durante la ejecución"""
+    import platform
+    return {
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'python_version': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
 def get_system_info() -> Dict[str, Any]:
     """
     Obtiene información del sistema operativo
@@ -146,23 +251,19 @@ def get_system_info() -> Dict[str, Any]:
         dict: Información del sistema
     """
     try:
-        import platform
+        # Una sola lectura de memoria para total y disponible
+        mem = psutil.virtual_memory()
         return {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'cpu_count': os.cpu_count(),
-            'total_memory_gb': psutil.virtual_memory().total / (1024**3),
-            'available_memory_gb': psutil.virtual_memory().available / (1024**3),
+            **_static_system_info(),
+            'total_memory_gb': mem.total / (1024**3),
+            'available_memory_gb': mem.available / (1024**3),
         }
     except Exception as e:
         logger.error(f"Error obteniendo información del sistema: {e}")
         return {}
 
 
+@lru_cache(maxsize=1)
 def get_qemu_version() -> Optional[str]:
     """
     Obtiene versión de QEMU instalada
@@ -317,6 +418,47 @@ def validate_cpu_cores(cores: int) -> Tuple[bool, str]:
 
 # ==================== UTILIDADES DE ARCHIVO ====================
 
+def _dumps_json(data: Dict) -> bytes:
+    """Serializa a JSON indentado (UTF-8); usa orjson si está instalado"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Tipos que orjson no admite (p. ej. enteros de más de 64 bits)
+            pass
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _copy_file(source, destination) -> None:
+    """
+    Copia contenido y metadatos (equivalente a shutil.copy2 entre archivos)
+    
+    En Linux se usa os.copy_file_range: el kernel copia los bloques sin pasar
+    por espacio de usuario y en btrfs/xfs puede compartirlos (reflink). Si no
+    está disponible o no aplica (p. ej. entre sistemas de archivos distintos
+    en kernels antiguos), se recurre a shutil.copyfile.
+    """
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                # El archivo pudo crecer: completar con la copia normal
+                copied = remaining == 0 and not src.read(1)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    
+    if not copied:
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
+
+
 def save_json(data: Dict, filepath: Path) -> bool:
     """
     Guarda datos en archivo JSON
@@ -330,8 +472,14 @@ def save_json(data: Dict, filepath: Path) -> bool:
     """
     try:
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = _dumps_json(data)
+        
+        # Escribir en un temporal y reemplazar: un fallo a mitad de escritura
+        # nunca deja el archivo original corrupto
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
         logger.info(f"Archivo guardado: {filepath}")
         return True
     except Exception as e:
@@ -339,6 +487,18 @@ def save_json(data: Dict, filepath: Path) -> bool:
         return False
 
 
+def _interned_dict(pairs) -> Dict:
+    """
+    Construye el dict de un objeto JSON con las claves internadas
+    
+    Las configuraciones repiten el mismo vocabulario de claves ("ram",
+    "cpus", ...); internadas, todas las cargas comparten el mismo objeto
+    por clave y las búsquedas y comparaciones entre configuraciones
+    (compare_configs) resuelven por identidad sin comparar caracteres.
+    """
+    return {sys.intern(key): value for key, value in pairs}
+
+
 def load_json(filepath: Path) -> Dict:
     """
     Carga datos desde archivo JSON
@@ -351,8 +511,9 @@ def load_json(filepath: Path) -> Dict:
     """
     try:
         if filepath.exists():
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            # En binario: JSON es UTF-8 y así no depende de la codificación local
+            with open(filepath, 'rb') as f:
+                data = json.loads(f.read(), object_pairs_hook=_interned_dict)
             logger.info(f"Archivo cargado: {filepath}")
             return data
     except json.JSONDecodeError as e:
@@ -381,7 +542,7 @@ def backup_file(filepath: Path) -> Optional[Path]:
         backup_path = config.BACKUP_DIR / f"{filepath.stem}_{timestamp}{filepath.suffix}"
         
         backup_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(filepath, backup_path)
+        _copy_file(filepath, backup_path)
         logger.info(f"Backup creado: {backup_path}")
         return backup_path
     except Exception as e:
@@ -399,18 +560,21 @@ def clean_old_backups(days: int = 30) -> int:
     Retorna:
         int: Cantidad de archivos eliminados
     """
+    if not config.BACKUP_DIR.is_dir():
+        return 0
+    
     try:
-        import time
-        current_time = time.time()
+        cutoff = time.time() - days * 86400
         deleted_count = 0
         
-        for backup_file in config.BACKUP_DIR.glob("*"):
-            if backup_file.is_file():
-                file_age_days = (current_time - backup_file.stat().st_mtime) / 86400
-                if file_age_days > days:
-                    backup_file.unlink()
+        # scandir da el tipo de cada entrada sin stat extra; solo se hace un
+        # stat por archivo para la fecha de modificación
+        with os.scandir(config.BACKUP_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
                     deleted_count += 1
-                    logger.info(f"Backup antiguo eliminado: {backup_file}")
+                    logger.info(f"Backup antiguo eliminado: {entry.path}")
         
         return deleted_count
     except Exception as e:
@@ -420,12 +584,12 @@ def clean_old_backups(days: int = 30) -> int:
 
 # ==================== UTILIDADES DE EJECUCIÓN DE COMANDOS ====================
 
-def run_command(command: str, timeout: int = config.QEMU_COMMAND_TIMEOUT) -> Tuple[int, str, str]:
+def run_command(argv: List[str], timeout: int = config.QEMU_COMMAND_TIMEOUT) -> Tuple[int, str, str]:
     """
-    Ejecuta comando en shell
+    Ejecuta un comando sin pasar por la shell
     
     Argumentos:
-        command: Comando a ejecutar
+        argv: Programa y argumentos, p. ej. [config.QEMU_IMG_BINARY, 'info', ruta]
         timeout: Timeout en segundos
     
     Retorna:
@@ -433,41 +597,39 @@ def run_command(command: str, timeout: int = config.QEMU_COMMAND_TIMEOUT) -> Tup
     """
     try:
         result = subprocess.run(
-            command,
-            shell=True,
+            argv,
             capture_output=True,
             text=True,
             timeout=timeout
         )
-        logger.debug(f"Comando ejecutado: {command}")
+        logger.debug(f"Comando ejecutado: {argv}")
         return result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
-        logger.error(f"Timeout ejecutando comando: {command}")
+        logger.error(f"Timeout ejecutando comando: {argv}")
         return -1, "", "Timeout"
     except Exception as e:
         logger.error(f"Error ejecutando comando: {e}")
         return -1, "", str(e)
 
 
-def run_command_async(command: str) -> Optional[subprocess.Popen]:
+def run_command_async(argv: List[str]) -> Optional[subprocess.Popen]:
     """
-    Ejecuta comando de forma asíncrona
+    Ejecuta comando de forma asíncrona, sin pasar por la shell
     
     Argumentos:
-        command: Comando a ejecutar
+        argv: Programa y argumentos
     
     Retorna:
         Popen: Objeto del proceso o None si falla
     """
     try:
         process = subprocess.Popen(
-            command,
-            shell=True,
+            argv,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True
         )
-        logger.info(f"Proceso iniciado: {command} (PID: {process.pid})")
+        logger.info(f"Proceso iniciado: {argv} (PID: {process.pid})")
         return process
     except Exception as e:
         logger.error(f"Error iniciando proceso: {e}")
@@ -504,6 +666,10 @@ def get_process_info(pid: int) -> Optional[Dict]:
 
 # ==================== UTILIDADES DE DISCO ====================
 
+# Líneas "clave: valor" de la salida en texto de qemu-img info
+_DISK_INFO_RE = re.compile(r'^([^:\n]+):[ \t]*(.+)$', re.M)
+
+
 def get_disk_info(disk_path: str) -> Optional[Dict]:
     """
     Obtiene información detallada de un disco QEMU
@@ -515,14 +681,17 @@ def get_disk_info(disk_path: str) -> Optional[Dict]:
         dict: Información del disco o None
     """
     try:
-        code, stdout, stderr = run_command(f"{config.QEMU_IMG_BINARY} info '{disk_path}'")
+        # qemu-img entrega la información ya estructurada (tamaños como enteros)
+        code, stdout, stderr = run_command(
+            [config.QEMU_IMG_BINARY, 'info', '--output=json', disk_path]
+        )
         
         if code == 0:
-            info = {}
-            for line in stdout.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    info[key.strip()] = value.strip()
+            try:
+                info = json.loads(stdout)
+            except ValueError:
+                # Versiones sin salida JSON: parsear el texto "clave: valor"
+                info = {key.strip(): value.strip() for key, value in _DISK_INFO_RE.findall(stdout)}
             
             logger.info(f"Info de disco obtenida: {disk_path}")
             return info
@@ -543,10 +712,10 @@ def get_disk_size(disk_path: str) -> Optional[float]:
         float: Tamaño en GB o None
     """
     try:
-        if Path(disk_path).exists():
-            size_bytes = Path(disk_path).stat().st_size
-            size_gb = size_bytes / (1024**3)
-            return size_gb
+        # Un solo stat: si el archivo no existe, no hay tamaño
+        return os.stat(disk_path).st_size / (1024**3)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Error obteniendo tamaño del disco: {e}")
     
@@ -555,16 +724,43 @@ def get_disk_size(disk_path: str) -> Optional[float]:
 
 # ==================== UTILIDADES DE BÚSQUEDA ====================
 
-def find_disk_images(search_path: str = None, extensions: List[str] = None) -> List[Path]:
+def _iter_files_with_suffix(root: str, suffixes, skip_hidden: bool = False) -> Iterator[Path]:
     """
-    Busca archivos de disco en el sistema
+    Genera los archivos bajo root cuya extensión está en suffixes
+    
+    Un solo recorrido con os.scandir: el tipo de cada entrada sale del
+    propio listado del directorio y solo los resultados se envuelven en Path.
+    suffixes son extensiones en minúsculas con punto ('.qcow2'); con
+    skip_hidden no se entra en directorios ocultos (cachés, .git, ...).
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (skip_hidden and entry.name.startswith('.')):
+                                stack.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in suffixes and entry.is_file():
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            # Directorio sin permisos o eliminado durante el recorrido
+            continue
+
+
+def find_disk_images_iter(search_path: str = None, extensions: List[str] = None) -> Iterator[Path]:
+    """
+    Genera los archivos de disco a medida que se encuentran
+    
+    Quien solo necesita los primeros resultados (itertools.islice) detiene
+    el recorrido sin visitar el resto del árbol.
     
     Argumentos:
-        search_path: Ruta inicial (por defecto: home)
+        search_path: Ruta inicial (por defecto: config.VM_SEARCH_PATHS)
         extensions: Extensiones a buscar (por defecto: qcow2, img, vdi, vmdk)
-    
-    Retorna:
-        list: Lista de rutas encontradas
     """
     if search_path is None:
         search_paths = config.VM_SEARCH_PATHS
@@ -574,20 +770,32 @@ def find_disk_images(search_path: str = None, extensions: List[str] = None) -> L
     if extensions is None:
         extensions = ["*.qcow2", "*.img", "*.vdi", "*.vmdk"]
     
-    found_images = []
+    # Admite tanto "*.qcow2" como ".qcow2"; el árbol se recorre una sola vez
+    # para todas las extensiones
+    suffixes = {'.' + ext.lstrip('*').lstrip('.').lower() for ext in extensions}
     
     for search_path in search_paths:
         try:
-            path_obj = Path(search_path)
-            if path_obj.exists():
-                for ext in extensions:
-                    for image in path_obj.rglob(ext):
-                        if image.is_file():
-                            found_images.append(image)
-                            logger.debug(f"Imagen encontrada: {image}")
+            if os.path.isdir(search_path):
+                for image in _iter_files_with_suffix(str(search_path), suffixes):
+                    logger.debug("Imagen encontrada: %s", image)
+                    yield image
         except Exception as e:
             logger.warning(f"Error buscando en {search_path}: {e}")
+
+
+def find_disk_images(search_path: str = None, extensions: List[str] = None) -> List[Path]:
+    """
+    Busca archivos de disco en el sistema
     
+    Argumentos:
+        search_path: Ruta inicial (por defecto: config.VM_SEARCH_PATHS)
+        extensions: Extensiones a buscar (por defecto: qcow2, img, vdi, vmdk)
+    
+    Retorna:
+        list: Lista de rutas encontradas
+    """
+    found_images = list(find_disk_images_iter(search_path, extensions))
     logger.info(f"Se encontraron {len(found_images)} imagen(es) de disco")
     return found_images
 
@@ -606,7 +814,9 @@ def find_iso_images(search_path: str = None) -> List[Path]:
         search_path = str(Path.home())
     
     try:
-        found_isos = list(Path(search_path).rglob("*.iso"))
+        # Recorrido con scandir sin entrar en directorios ocultos del home;
+        # acepta también .ISO
+        found_isos = list(_iter_files_with_suffix(str(search_path), {'.iso'}, skip_hidden=True))
         logger.info(f"Se encontraron {len(found_isos)} ISO(s)")
         return found_isos
     except Exception as e:
@@ -657,6 +867,10 @@ def seconds_to_human_readable(seconds: int) -> str:
 
 # ==================== UTILIDADES DE FORMATO ====================
 
+# Caracteres no permitidos en nombres de archivo
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+
 def sanitize_string(text: str, max_length: int = 100) -> str:
     """
     Sanitiza texto removiendo caracteres especiales
@@ -668,11 +882,8 @@ def sanitize_string(text: str, max_length: int = 100) -> str:
     Retorna:
         str: Texto sanitizado
     """
-    # Remover caracteres especiales
-    text = re.sub(r'[<>:"/\\|?*]', '', text)
-    # Limitar longitud
-    text = text[:max_length]
-    return text
+    # Remover caracteres especiales y limitar longitud
+    return _SANITIZE_RE.sub('', text)[:max_length]
 
 
 def format_datetime(dt: datetime = None, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
@@ -704,27 +915,54 @@ def is_port_available(port: int) -> bool:
         bool: True si está disponible
     """
     import socket
+    # Se intenta reservar el puerto: bind falla al instante contra la tabla
+    # de puertos locales, sin handshake TCP, y un connect rechazado no
+    # garantiza que el puerto se pueda usar
+    sock = None
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('127.0.0.1', port))
-        sock.close()
-        return result != 0
-    except Exception as e:
-        logger.error(f"Error verificando puerto: {e}")
+        sock.bind(('127.0.0.1', port))
+        return True
+    except OSError as e:
+        if e.errno != errno.EADDRINUSE:
+            logger.error(f"Error verificando puerto: {e}")
         return False
+    finally:
+        if sock is not None:
+            sock.close()
 
 
-def find_available_port(start_port: int = 5000, end_port: int = 6000) -> Optional[int]:
+def find_available_port(start_port: Optional[int] = None, end_port: Optional[int] = None) -> Optional[int]:
     """
     Encuentra un puerto TCP disponible
     
+    Sin rango, el kernel asigna un puerto libre en una sola llamada (bind al
+    puerto 0). Con rango, se prueban los puertos de [start_port, end_port).
+    
     Argumentos:
-        start_port: Puerto inicial
-        end_port: Puerto final
+        start_port: Puerto inicial (por defecto: cualquiera)
+        end_port: Puerto final, excluido (por defecto: start_port + 1000)
     
     Retorna:
         int: Puerto disponible o None
     """
+    if start_port is None and end_port is None:
+        import socket
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            logger.info(f"Puerto disponible asignado por el sistema: {port}")
+            return port
+        except OSError as e:
+            logger.error(f"Error obteniendo puerto libre: {e}")
+            return None
+    
+    if start_port is None:
+        start_port = 1024
+    if end_port is None:
+        end_port = start_port + 1000
+    
     for port in range(start_port, end_port):
         if is_port_available(port):
             logger.info(f"Puerto disponible encontrado: {port}")
@@ -737,40 +975,73 @@ def find_available_port(start_port: int = 5000, end_port: int = 6000) -> Optiona
 # ==================== UTILIDADES DE CACHÉ ====================
 
 class SimpleCache:
-    """Caché simple en memoria con TTL"""
+    """
+    Caché simple en memoria con TTL
+    
+    Cada entrada guarda (valor, instante) en un único diccionario; el
+    instante es time.monotonic(), así que la edad es una resta de floats y
+    no depende de cambios en el reloj del sistema.
+    """
     
     def __init__(self):
         self.cache = {}
-        self.timestamps = {}
     
     def set(self, key: str, value: Any, ttl: int = 300):
         """Almacena valor en caché"""
-        self.cache[key] = value
-        self.timestamps[key] = datetime.now()
+        self.cache[key] = (value, time.monotonic())
     
     def get(self, key: str, ttl: int = 300) -> Optional[Any]:
         """Obtiene valor del caché si no ha expirado"""
-        if key not in self.cache:
+        entry = self.cache.get(key)
+        if entry is None:
             return None
         
-        age = (datetime.now() - self.timestamps[key]).total_seconds()
-        if age > ttl:
+        value, stored_at = entry
+        if time.monotonic() - stored_at > ttl:
             del self.cache[key]
-            del self.timestamps[key]
             return None
         
-        return self.cache[key]
+        return value
     
     def clear(self):
         """Limpia el caché"""
         self.cache.clear()
-        self.timestamps.clear()
 
 
 # Instancia global de caché
 cache = SimpleCache()
 
 
+def ttl_cache(seconds: int = 5):
+    """
+    Decorador que memoriza el resultado durante seconds segundos
+    
+    Cada función decorada tiene su propio SimpleCache, con los argumentos
+    como clave. Pensado para consultas al sistema que una GUI puede pedir
+    en cada refresco.
+    
+    Uso:
+        @ttl_cache(seconds=5)
+        def consulta_costosa():
+            pass
+    """
+    def decorator(func):
+        func_cache = SimpleCache()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            value = func_cache.get(key, ttl=seconds)
+            if value is None:
+                value = func(*args, **kwargs)
+                func_cache.set(key, value)
+            return value
+        
+        wrapper.cache_clear = func_cache.clear
+        return wrapper
+    return decorator
+
+
 # ==================== FUNCIÓN PRINCIPAL DE DIAGNÓSTICO ====================
 
 def run_diagnostics() -> Dict[str, Any]:
@@ -782,6 +1053,9 @@ def run_diagnostics() -> Dict[str, Any]:
     """
     logger.info("=== Iniciando diagnóstico del sistema ===")
     
+    # Una sola consulta de espacio para todos los campos
+    home_total, _home_used, home_free = check_disk_space(str(Path.home()))
+    
     diagnostics = {
         'timestamp': format_datetime(),
         'system_info': get_system_info(),
@@ -793,8 +1067,8 @@ def run_diagnostics() -> Dict[str, Any]:
         'config_dir_exists': config.CONFIG_DIR.exists(),
         'disk_space': {
             'home': {
-                'total_gb': check_disk_space(str(Path.home()))[0],
-                'available_gb': check_disk_space(str(Path.home()))[2]
+                'total_gb': home_total,
+                'available_gb': home_free
             }
         }
     }
@@ -830,27 +1104,39 @@ def log_execution(func):
     return wrapper
 
 
-def retry(max_attempts: int = 3, delay: int = 1):
+# Errores que no se resuelven reintentando: se propagan de inmediato
+_NON_RETRIABLE_ERRORS = (FileNotFoundError, PermissionError, IsADirectoryError, NotADirectoryError)
+
+
+def retry(max_attempts: int = 3, delay: float = 1, retriable: tuple = (OSError,)):
     """
     Decorador para reintentar función en caso de fallo
     
+    Solo se reintentan las excepciones de retriable (salvo las de
+    _NON_RETRIABLE_ERRORS); la espera crece de forma exponencial
+    (delay, 2*delay, 4*delay...) con un pequeño componente aleatorio para
+    que varios reintentos simultáneos no coincidan.
+    
     Uso:
         @retry(max_attempts=3, delay=2)
         def operacion_critica():
             pass
     """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import time
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except _NON_RETRIABLE_ERRORS:
+                    raise
+                except retriable as e:
                     if attempt == max_attempts - 1:
                         logger.error(f"Fallo tras {max_attempts} intentos: {e}")
                         raise
-                    logger.warning(f"Intento {attempt + 1} falló, reintentando en {delay}s...")
-                    time.sleep(delay)
+                    wait_s = delay * 2 ** attempt + random.random() * 0.1
+                    logger.warning(f"Intento {attempt + 1} falló, reintentando en {wait_s:.1f}s...")
+                    time.sleep(wait_s)
         return wrapper
     return decorator
 
@@ -876,14 +1162,32 @@ def timing(func):
 
 # ==================== UTILIDADES DE ESTADÍSTICAS ====================
 
+# Sistemas de archivos que no se consultan (ópticos, imágenes de solo lectura)
+_SKIPPED_FSTYPES = frozenset({'', 'iso9660', 'udf', 'squashfs'})
+
+# Plazo común para las consultas de uso de disco (segundos)
+_DISK_USAGE_TIMEOUT = 2
+
 class SystemMonitor:
     """Monitor de recursos del sistema"""
     
+    # Indica si psutil ya tiene una muestra de CPU de referencia
+    _cpu_sampled = False
+    
     @staticmethod
-    def get_cpu_usage() -> float:
-        """Obtiene uso de CPU en porcentaje"""
+    def get_cpu_usage(interval: Optional[float] = None) -> float:
+        """
+        Obtiene uso de CPU en porcentaje
+        
+        Con interval=None no bloquea: psutil compara con la muestra de la
+        llamada anterior. Solo la primera llamada espera 0.1 s para tener
+        una referencia.
+        """
         try:
-            return psutil.cpu_percent(interval=1)
+            if interval is None and not SystemMonitor._cpu_sampled:
+                SystemMonitor._cpu_sampled = True
+                return psutil.cpu_percent(interval=0.1)
+            return psutil.cpu_percent(interval=interval)
         except Exception as e:
             logger.error(f"Error obteniendo CPU: {e}")
             return 0.0
@@ -904,21 +1208,64 @@ class SystemMonitor:
             return {}
     
     @staticmethod
+    @ttl_cache(seconds=5)
     def get_disk_usage_all() -> Dict[str, Dict]:
-        """Obtiene uso de disco de todas las particiones"""
+        """
+        Obtiene uso de disco de todas las particiones
+        
+        Se omiten unidades ópticas y dispositivos loop (snaps, ISOs montadas).
+        Las consultas se lanzan en paralelo con un plazo común: un punto de
+        montaje que no responde (red, unidad vacía) se omite en lugar de
+        bloquear toda la llamada.
+        """
         try:
-            result = {}
-            for partition in psutil.disk_partitions():
+            mountpoints = [
+                partition.mountpoint
+                for partition in psutil.disk_partitions(all=False)
+                if partition.fstype not in _SKIPPED_FSTYPES
+                and not partition.device.startswith('/dev/loop')
+            ]
+            if not mountpoints:
+                return {}
+            
+            # Hilos daemon en lugar de un ThreadPoolExecutor: concurrent.futures
+            # une sus hilos al salir del intérprete, y uno bloqueado en statvfs
+            # sobre un montaje colgado impediría cerrar la aplicación
+            results = queue.SimpleQueue()
+            
+            def probe(mountpoint):
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    result[partition.mountpoint] = {
-                        'total_gb': usage.total / (1024**3),
-                        'used_gb': usage.used / (1024**3),
-                        'free_gb': usage.free / (1024**3),
-                        'percent': usage.percent
-                    }
-                except:
-                    pass
+                    results.put((mountpoint, psutil.disk_usage(mountpoint)))
+                except Exception:
+                    results.put((mountpoint, None))
+            
+            for mountpoint in mountpoints:
+                threading.Thread(target=probe, args=(mountpoint,), daemon=True).start()
+            
+            usages = {}
+            deadline = time.monotonic() + _DISK_USAGE_TIMEOUT
+            for _ in mountpoints:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    mountpoint, usage = results.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                usages[mountpoint] = usage
+            
+            # En el orden de las particiones, no en el de llegada
+            result = {}
+            for mountpoint in mountpoints:
+                usage = usages.get(mountpoint)
+                if usage is None:
+                    continue
+                result[mountpoint] = {
+                    'total_gb': usage.total / (1024**3),
+                    'used_gb': usage.used / (1024**3),
+                    'free_gb': usage.free / (1024**3),
+                    'percent': usage.percent
+                }
             return result
         except Exception as e:
             logger.error(f"Error obteniendo discos: {e}")
@@ -955,11 +1302,30 @@ class SystemMonitor:
 
 # ==================== UTILIDADES DE PROCESAMIENTO ====================
 
+def _process_item(callback, item) -> Tuple[bool, Any]:
+    """Ejecuta callback(item) capturando el error; retorna (ok, resultado)"""
+    try:
+        return True, callback(item)
+    except Exception as e:
+        logger.error(f"Error procesando {item}: {e}")
+        return False, None
+
+
 class BatchProcessor:
-    """Procesa lotes de elementos"""
+    """
+    Procesa lotes de elementos
     
-    def __init__(self, batch_size: int = 100):
+    Los elementos de cada lote se procesan en paralelo con un pool de hilos
+    (callbacks de E/S: comandos, disco). Con use_processes=True se usa un
+    pool de procesos para callbacks de CPU; en ese caso callback y elementos
+    deben ser serializables con pickle.
+    """
+    
+    def __init__(self, batch_size: int = 100, max_workers: Optional[int] = None,
+                 use_processes: bool = False):
         self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.use_processes = use_processes
     
     def process_batch(self, items: List[Any], callback) -> List[Any]:
         """
@@ -970,20 +1336,24 @@ class BatchProcessor:
             callback: Función de procesamiento
         
         Retorna:
-            list: Resultados procesados
+            list: Resultados procesados, en el orden de items (se omiten los
+            elementos cuyo callback falló)
         """
         results = []
+        if not items:
+            return results
         
-        for i in range(0, len(items), self.batch_size):
-            batch = items[i:i + self.batch_size]
-            logger.info(f"Procesando lote {i//self.batch_size + 1}")
-            
-            for item in batch:
-                try:
-                    result = callback(item)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Error procesando {item}: {e}")
+        executor_cls = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        max_workers = self.max_workers or min(32, len(items), self.batch_size)
+        
+        with executor_cls(max_workers=max_workers) as executor:
+            for i in range(0, len(items), self.batch_size):
+                batch = items[i:i + self.batch_size]
+                logger.info(f"Procesando lote {i//self.batch_size + 1}")
+                
+                for ok, result in executor.map(_process_item, repeat(callback), batch):
+                    if ok:
+                        results.append(result)
         
         return results
 
@@ -1025,7 +1395,9 @@ def copy_file_safe(source: str, destination: str) -> bool:
             return False
         
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_path, dest_path)
+        if dest_path.is_dir():
+            dest_path = dest_path / source_path.name
+        _copy_file(source_path, dest_path)
         logger.info(f"Archivo copiado: {source} -> {destination}")
         return True
     except Exception as e:
@@ -1087,41 +1459,193 @@ def delete_file_safe(filepath: str) -> bool:
 
 # ==================== UTILIDADES DE CONFIGURACIÓN DINÁMICA ====================
 
-def load_env_file(env_path: str = ".env") -> Dict[str, str]:
+# Línea "CLAVE=valor" de un .env (se ignoran vacías y comentarios '#')
+_ENV_LINE_RE = re.compile(rb'(?m)^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*\r?$')
+
+
+# Resultados de load_env_file por ruta absoluta: ((mtime_ns, tamaño), variables)
+_ENV_CACHE: Dict[str, Tuple[Tuple[int, int], Mapping[str, str]]] = {}
+
+# Resumen en disco del último parseo, junto al .env: evita parsear al arrancar
+_ENV_DIGEST_SUFFIX = '.cache'
+
+# Resultado vacío compartido (archivo ausente o ilegible)
+_EMPTY_ENV: Mapping[str, str] = MappingProxyType({})
+
+
+def load_env_file(env_path: str = ".env") -> Mapping[str, str]:
     """
     Carga variables de archivo .env
     
+    El resultado se memoriza por ruta mientras el archivo no cambie (fecha
+    de modificación y tamaño); se devuelve de solo lectura porque se
+    comparte entre llamadas. load_env_file.cache_clear() vacía la caché.
+    Entre ejecuciones se reutiliza el resumen <env_path>.cache si coincide
+    con la versión actual del archivo.
+    
     Argumentos:
         env_path: Ruta del archivo .env
     
     Retorna:
-        dict: Variables cargadas
+        Mapping: Variables cargadas
     """
-    env_vars = {}
-    env_file = Path(env_path)
-    
-    if not env_file.exists():
-        logger.warning(f"Archivo .env no encontrado: {env_path}")
-        return env_vars
+    try:
+        st = os.stat(env_path)
+    except FileNotFoundError:
+        logger.warning("Archivo .env no encontrado: %s", env_path)
+        return _EMPTY_ENV
+    except OSError as e:
+        logger.error("Error cargando .env: %s", e)
+        return _EMPTY_ENV
+    
+    abs_path = os.path.abspath(env_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _ENV_CACHE.get(abs_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    digest_vars = _read_env_digest(env_path, stamp)
+    if digest_vars is not None:
+        result = MappingProxyType(digest_vars)
+        _ENV_CACHE[abs_path] = (stamp, result)
+        return result
     
+    env_vars = {}
     try:
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip().strip('"\'')
+        with open(env_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                # Se mapea el archivo y una sola expresión recorre todas las
+                # líneas; solo se decodifican las claves y valores capturados.
+                # Un byte no UTF-8 se sustituye por U+FFFD en lugar de
+                # abortar la carga a medias
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    for match in _ENV_LINE_RE.finditer(mm):
+                        key, value = match.groups()
+                        env_vars[key.decode('utf-8', 'replace')] = (
+                            value.strip(b'"\'').decode('utf-8', 'replace')
+                        )
         
-        logger.info(f"Variables cargadas desde {env_path}: {len(env_vars)}")
-    except Exception as e:
-        logger.error(f"Error cargando .env: {e}")
+        logger.info("Variables cargadas desde %s: %s", env_path, len(env_vars))
+    except (OSError, ValueError) as e:
+        # Error de lectura (transitorio): no se cachea, se reintenta la próxima vez
+        logger.error("Error cargando .env: %s", e)
+        return _EMPTY_ENV
+    
+    _write_env_digest(env_path, stamp, env_vars)
+    result = MappingProxyType(env_vars)
+    _ENV_CACHE[abs_path] = (stamp, result)
+    return result
+
+
+load_env_file.cache_clear = _ENV_CACHE.clear
+
+
+def _read_env_digest(env_path: str, stamp: Tuple[int, int]) -> Optional[Dict[str, str]]:
+    """Variables del resumen en disco si corresponde a la versión actual del .env"""
+    try:
+        with open(env_path + _ENV_DIGEST_SUFFIX, 'rb') as f:
+            digest = json.loads(f.read())
+        if (digest['mtime_ns'], digest['size']) == stamp and isinstance(digest['vars'], dict):
+            return digest['vars']
+    except (OSError, ValueError, KeyError, TypeError):
+        # Sin resumen, corrupto o de otro formato: se vuelve a parsear
+        pass
+    return None
+
+
+def _write_env_digest(env_path: str, stamp: Tuple[int, int], env_vars: Dict[str, str]) -> None:
+    """
+    Guarda el resultado del parseo junto al .env (escritura atómica)
     
-    return env_vars
+    El resumen contiene los valores en claro, así que se crea solo legible
+    por el propietario (0600) sea cual sea la umask.
+    """
+    digest_path = env_path + _ENV_DIGEST_SUFFIX
+    tmp_path = digest_path + '.tmp'
+    try:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(tmp_path, flags, 0o600)
+        # Un .tmp previo conserva su modo: se corrige explícitamente
+        # (os.fchmod no existe en Windows, donde el modo no aplica)
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o600)
+        with open(fd, 'wb') as f:
+            f.write(json.dumps({'mtime_ns': stamp[0], 'size': stamp[1], 'vars': env_vars}).encode('utf-8'))
+        os.replace(tmp_path, digest_path)
+    except OSError as e:
+        # Directorio de solo lectura, etc.: la caché en disco es opcional
+        logger.debug("No se pudo guardar la caché de %s: %s", env_path, e)
 
 
 # ==================== UTILIDADES DE COMPARACIÓN ====================
 
-def compare_configs(config1: Dict, config2: Dict) -> Dict[str, Any]:
+# A partir de cuántas claves comunes compensa comparar con numpy
+_NUMPY_COMPARE_MIN_KEYS = 1024
+
+# Enteros que float64 representa sin pérdida
+_FLOAT64_EXACT_INT = 2 ** 53
+
+
+def _is_exact_number(value) -> bool:
+    """True si value es int/float y convertirlo a float64 no altera la comparación"""
+    value_type = type(value)
+    if value_type is float:
+        return True
+    return value_type is int and -_FLOAT64_EXACT_INT <= value <= _FLOAT64_EXACT_INT
+
+
+def _changed_keys_numpy(config1: Dict, config2: Dict, common) -> List:
+    """
+    Claves comunes con valores distintos, comparando los numéricos con numpy
+    
+    Los pares numéricos se comparan en un solo numpy.not_equal; el resto
+    (cadenas, listas, dicts...) con != de Python.
+    """
+    numeric_keys = []
+    changed = []
+    for key in common:
+        value1, value2 = config1[key], config2[key]
+        if _is_exact_number(value1) and _is_exact_number(value2):
+            numeric_keys.append(key)
+        elif value1 != value2:
+            changed.append(key)
+    
+    if numeric_keys:
+        count = len(numeric_keys)
+        values1 = np.fromiter((config1[key] for key in numeric_keys), dtype=np.float64, count=count)
+        values2 = np.fromiter((config2[key] for key in numeric_keys), dtype=np.float64, count=count)
+        changed.extend(numeric_keys[i] for i in np.flatnonzero(values1 != values2))
+    
+    return changed
+
+
+@dataclass
+class ConfigDiff:
+    """
+    Diferencias entre dos configuraciones
+    
+    modified asocia cada clave a la tupla (valor_anterior, valor_nuevo).
+    to_dict() devuelve el formato anterior de diccionarios anidados.
+    """
+    __slots__ = ('added', 'removed', 'modified')
+    
+    added: Dict[str, Any]
+    removed: Dict[str, Any]
+    modified: Dict[str, Tuple[Any, Any]]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Formato {'added', 'removed', 'modified': {clave: {'old', 'new'}}}"""
+        return {
+            'added': dict(self.added),
+            'removed': dict(self.removed),
+            'modified': {key: {'old': old, 'new': new} for key, (old, new) in self.modified.items()},
+        }
+
+
+def compare_configs(config1: Dict, config2: Dict) -> ConfigDiff:
     """
     Compara dos configuraciones
     
@@ -1130,38 +1654,32 @@ def compare_configs(config1: Dict, config2: Dict) -> Dict[str, Any]:
         config2: Segunda configuración
     
     Retorna:
-        dict: Diferencias encontradas
+        ConfigDiff: Diferencias encontradas
     """
-    differences = {
-        'added': {},
-        'removed': {},
-        'modified': {}
-    }
+    # Operaciones de conjuntos sobre las vistas de claves (en C)
+    keys1, keys2 = config1.keys(), config2.keys()
+    common = keys1 & keys2
     
-    # Elementos añadidos
-    for key, value in config2.items():
-        if key not in config1:
-            differences['added'][key] = value
-    
-    # Elementos removidos
-    for key, value in config1.items():
-        if key not in config2:
-            differences['removed'][key] = value
-    
-    # Elementos modificados
-    for key in config1:
-        if key in config2 and config1[key] != config2[key]:
-            differences['modified'][key] = {
-                'old': config1[key],
-                'new': config2[key]
-            }
+    if np is not None and len(common) >= _NUMPY_COMPARE_MIN_KEYS:
+        changed = _changed_keys_numpy(config1, config2, common)
+    else:
+        changed = [key for key in common if config1[key] != config2[key]]
+    
+    differences = ConfigDiff(
+        added={key: config2[key] for key in keys2 - keys1},
+        removed={key: config1[key] for key in keys1 - keys2},
+        modified={key: (config1[key], config2[key]) for key in changed},
+    )
     
-    logger.info(f"Comparación completada: {len(differences['modified'])} diferencias")
+    logger.info("Comparación completada: %s diferencias", len(differences.modified))
     return differences
 
 
 # ==================== UTILIDADES DE GENERACIÓN ====================
 
+# Prefijo OUI de Xen, habitual para NICs virtuales
+_MAC_OUI = "00:16:3e"
+
 def generate_unique_name(prefix: str = "vm", existing: List[str] = None) -> str:
     """
     Genera nombre único para VM
@@ -1173,14 +1691,14 @@ def generate_unique_name(prefix: str = "vm", existing: List[str] = None) -> str:
     Retorna:
         str: Nombre único generado
     """
-    if existing is None:
-        existing = []
+    # Conjunto: cada comprobación es O(1) y como mucho hay len(existing) + 1
+    existing_set = set(existing or ())
     
     counter = 1
     while True:
         name = f"{prefix}_{counter}"
-        if name not in existing:
-            logger.info(f"Nombre único generado: {name}")
+        if name not in existing_set:
+            logger.info("Nombre único generado: %s", name)
             return name
         counter += 1
 
@@ -1192,10 +1710,9 @@ def generate_mac_address() -> str:
     Retorna:
         str: Dirección MAC en formato 00:11:22:33:44:55
     """
-    import random
-    mac = [0x00, 0x16, 0x3e, random.randint(0x00, 0x7f), random.randint(0x00, 0xff), random.randint(0x00, 0xff)]
-    mac_str = ':'.join(map(lambda x: "%02x" % x, mac))
-    logger.debug(f"MAC address generada: {mac_str}")
+    b = os.urandom(3)
+    mac_str = f"{_MAC_OUI}:{b[0] & 0x7f:02x}:{b[1]:02x}:{b[2]:02x}"
+    logger.debug("MAC address generada: %s", mac_str)
     return mac_str
 
 
@@ -1206,92 +1723,449 @@ def generate_uuid() -> str:
     Retorna:
         str: UUID generado
     """
-    import uuid
     new_uuid = str(uuid.uuid4())
-    logger.debug(f"UUID generado: {new_uuid}")
+    logger.debug("UUID generado: %s", new_uuid)
     return new_uuid
 
 
+def generate_macs(count: int) -> List[str]:
+    """
+    Genera varias direcciones MAC aleatorias de una vez
+    
+    Una sola lectura de os.urandom y una sola conversión a hexadecimal para
+    todo el lote, en lugar de una por dirección.
+    
+    Argumentos:
+        count: Número de direcciones
+    
+    Retorna:
+        list: Direcciones MAC en formato 00:11:22:33:44:55
+    """
+    buf = bytearray(os.urandom(3 * count))
+    buf[0::3] = bytes(b & 0x7f for b in buf[0::3])
+    hexbuf = binascii.hexlify(buf).decode()
+    return [
+        f"{_MAC_OUI}:{hexbuf[i:i + 2]}:{hexbuf[i + 2:i + 4]}:{hexbuf[i + 4:i + 6]}"
+        for i in range(0, 6 * count, 6)
+    ]
+
+
+def generate_uuids(count: int) -> List[str]:
+    """
+    Genera varios UUID versión 4 de una vez
+    
+    Argumentos:
+        count: Número de UUID
+    
+    Retorna:
+        list: UUID generados
+    """
+    raw = bytearray(os.urandom(16 * count))
+    # Marcas de versión (4) y variante (RFC 4122) en cada bloque de 16 bytes
+    raw[6::16] = bytes((b & 0x0f) | 0x40 for b in raw[6::16])
+    raw[8::16] = bytes((b & 0x3f) | 0x80 for b in raw[8::16])
+    return [str(uuid.UUID(bytes=bytes(raw[i:i + 16]))) for i in range(0, 16 * count, 16)]
+
+
 # ==================== UTILIDADES DE NOTIFICACIÓN ====================
 
+# Centinela para distinguir "no suscrito" de cualquier valor almacenado
+_MISSING = object()
+
+
+class _AsyncDispatcher:
+    """
+    Cola de notificaciones atendida por un hilo de fondo
+    
+    El hilo (daemon) se crea con la primera notificación encolada y llama a
+    deliver(event, data, level) en orden de llegada; quien notifica no
+    espera a los observadores.
+    """
+    
+    def __init__(self, deliver):
+        self._deliver = deliver
+        self._queue = None
+        self._worker = None
+        self._start_lock = threading.Lock()
+    
+    def submit(self, event: str, data: Any, level: int):
+        if self._worker is None:
+            with self._start_lock:
+                if self._worker is None:
+                    self._queue = queue.SimpleQueue()
+                    self._worker = threading.Thread(
+                        target=self._run, name='notification-dispatch', daemon=True
+                    )
+                    self._worker.start()
+        self._queue.put((event, data, level))
+    
+    def _run(self):
+        while True:
+            event, data, level = self._queue.get()
+            try:
+                self._deliver(event, data, level)
+            except Exception as e:
+                logger.error("Error despachando evento %s: %s", event, e)
+
+
 class NotificationCenter:
-    """Centro de notificaciones"""
+    """
+    Centro de notificaciones
     
-    def __init__(self):
+    observers asocia cada evento a un dict
+    {callback: (level, batchable, intervalo)}: conserva el orden de
+    suscripción y permite comprobar y quitar un callback en O(1).
+    
+    Cada observador indica un nivel al suscribirse y solo se le llama para
+    notificaciones de nivel igual o superior; con los valores por defecto
+    (0 en ambos lados) se notifica a todos, como antes.
+    
+    Los observadores suscritos con batchable=True reciben siempre una lista
+    de datos: dentro de un bloque "with centro.batch():" las notificaciones
+    se acumulan y se entregan juntas al salir; fuera, como lista de uno. El
+    bloque solo afecta al hilo que lo abre.
+    
+    Con async_dispatch=True, notify() solo encola y un hilo de fondo llama
+    a los observadores; enqueue_notification() encola siempre.
+    
+    Un observador suscrito con max_hz recibe como mucho max_hz llamadas por
+    segundo: las notificaciones intermedias se sobrescriben y, al vencer el
+    intervalo, se le entrega solo el dato más reciente (desde un hilo de
+    temporizador).
+    """
+    
+    def __init__(self, async_dispatch: bool = False):
         self.observers = {}
+        self.async_dispatch = async_dispatch
+        # Profundidad de batch() y notificaciones retenidas, por hilo
+        self._local = threading.local()
+        # Limitación por max_hz: último dato por (evento, callback) y claves
+        # con un temporizador armado o una entrega en curso. Los modifican
+        # quien notifica y el hilo del temporizador: van bajo _latest_lock
+        self._latest = {}
+        self._armed = set()
+        self._latest_lock = threading.Lock()
+        self._dispatcher = _AsyncDispatcher(self._deliver)
+    
+    def subscribe(self, event: str, callback, batchable: bool = False, level: int = 0,
+                  max_hz: Optional[float] = None):
+        """Suscribirse a un evento"""
+        interval = 1.0 / max_hz if max_hz else 0.0
+        self.observers.setdefault(event, {})[callback] = (level, batchable, interval)
+        logger.debug("Observador suscrito a: %s", event)
     
-    def subscribe(self, event: str, callback):
+    def unsubscribe(self, event: str, callback):
+        """Desuscribirse de un evento"""
+        callbacks = self.observers.get(event)
+        if callbacks is not None and callbacks.pop(callback, _MISSING) is not _MISSING:
+            logger.debug("Observador desuscrito de: %s", event)
+    
+    def notify(self, event: str, data: Any = None, level: int = 0):
+        """Notifica a los observadores suscritos con nivel <= level"""
+        if self.async_dispatch:
+            self._dispatcher.submit(event, data, level)
+        else:
+            self._deliver(event, data, level)
+    
+    def enqueue_notification(self, event: str, data: Any = None, level: int = 0):
+        """Encola la notificación para el hilo de fondo y retorna de inmediato"""
+        self._dispatcher.submit(event, data, level)
+    
+    def _deliver(self, event: str, data: Any = None, level: int = 0):
+        """Llama a los observadores en el hilo actual"""
+        log_error = logger.error
+        for callback, payload in self._collect(event, data, level):
+            try:
+                callback(payload)
+            except Exception as e:
+                log_error("Error notificando evento %s: %s", event, e)
+    
+    def _collect(self, event: str, data: Any, level: int):
+        """
+        Registra la notificación y retorna las llamadas inmediatas
+        
+        Actualiza el estado (retenidas por batch(), limitadas por max_hz) sin
+        llamar a ningún observador: ShardedNotificationCenter lo invoca con
+        el candado tomado y llama a los observadores ya sin él.
+        
+        Retorna:
+            list: Pares (callback, dato) a entregar ahora
+        """
+        callbacks = self.observers.get(event)
+        if not callbacks:
+            return ()
+        
+        local = self._local
+        batching = getattr(local, 'depth', 0) > 0
+        # Copia: un callback puede suscribir o desuscribir durante el envío
+        subscriptions = tuple(callbacks.items())
+        
+        if batching and any(batchable and obs_level <= level
+                            for _, (obs_level, batchable, _) in subscriptions):
+            local.pending.setdefault(event, []).append((level, data))
+        
+        calls = []
+        for callback, (obs_level, batchable, interval) in subscriptions:
+            if obs_level > level:
+                continue
+            if batchable:
+                if batching:
+                    continue
+                payload = [data]
+            else:
+                payload = data
+            if interval:
+                self._coalesce(event, callback, payload, interval)
+                continue
+            calls.append((callback, payload))
+        return calls
+    
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa las notificaciones del bloque para los observadores batchable
+        
+        Los bloques pueden anidarse; la entrega ocurre al salir del exterior.
+        """
+        self._enter_batch()
+        try:
+            yield self
+        finally:
+            for event, callback, datas in self._exit_batch():
+                self._dispatch(event, callback, datas)
+    
+    def _enter_batch(self):
+        """Abre un nivel de batch() en el hilo actual"""
+        local = self._local
+        depth = getattr(local, 'depth', 0)
+        if depth == 0:
+            local.pending = {}
+        local.depth = depth + 1
+    
+    def _exit_batch(self):
+        """
+        Cierra un nivel de batch() en el hilo actual
+        
+        Retorna:
+            list: Tríos (evento, callback, datos) a entregar; vacía salvo al
+                  cerrar el bloque exterior
+        """
+        local = self._local
+        local.depth -= 1
+        if local.depth or not local.pending:
+            return []
+        
+        pending, local.pending = local.pending, {}
+        calls = []
+        for event, items in pending.items():
+            for callback, (obs_level, batchable, _) in tuple(self.observers.get(event, {}).items()):
+                if not batchable:
+                    continue
+                datas = [data for level, data in items if obs_level <= level]
+                if datas:
+                    calls.append((event, callback, datas))
+        return calls
+    
+    def _coalesce(self, event: str, callback, payload: Any, interval: float):
+        """Guarda el último dato y programa su entrega si no hay una pendiente"""
+        key = (event, callback)
+        with self._latest_lock:
+            self._latest[key] = payload
+            if key in self._armed:
+                return
+            self._armed.add(key)
+        self._arm(key, interval)
+    
+    def _arm(self, key, interval: float):
+        """Programa la entrega del último dato de key tras interval segundos"""
+        timer = threading.Timer(interval, self._flush_latest, args=(key, interval))
+        timer.daemon = True
+        timer.start()
+    
+    def _flush_latest(self, key, interval: float):
+        """
+        Entrega el dato más reciente acumulado para un observador limitado
+        
+        La clave sigue armada mientras se llama al observador: un dato que
+        llegue durante la entrega no lanza otro temporizador, sino que se
+        reprograma al terminar, un intervalo después.
+        """
+        with self._latest_lock:
+            payload = self._latest.pop(key, _MISSING)
+            if payload is _MISSING:
+                self._armed.discard(key)
+                return
+        
+        event, callback = key
+        if callback in self.observers.get(event, ()):
+            self._dispatch(event, callback, payload)
+        
+        with self._latest_lock:
+            if key not in self._latest:
+                self._armed.discard(key)
+                return
+        self._arm(key, interval)
+    
+    def _dispatch(self, event: str, callback, data: Any):
+        """Llama a un observador aislando sus errores"""
+        try:
+            callback(data)
+        except Exception as e:
+            logger.error("Error notificando evento %s: %s", event, e)
+
+
+class ShardedNotificationCenter:
+    """
+    Centro de notificaciones seguro entre hilos
+    
+    Reparte los eventos entre varios NotificationCenter (16 por defecto) según
+    el hash del nombre, cada uno con su propio candado: hilos que trabajan
+    con eventos distintos rara vez compiten por el mismo. El candado solo
+    protege el registro de observadores; a estos se les llama ya sin él,
+    así que un callback puede esperar a otro hilo que notifique o suscriba
+    sin riesgo de interbloqueo. Misma API pública que NotificationCenter.
+    """
+    
+    def __init__(self, shards: int = 16, async_dispatch: bool = False):
+        self._shards = [NotificationCenter() for _ in range(shards)]
+        self._locks = [threading.RLock() for _ in range(shards)]
+        self.async_dispatch = async_dispatch
+        self._dispatcher = _AsyncDispatcher(self._deliver)
+    
+    def _route(self, event: str):
+        """(centro, candado) responsables del evento"""
+        index = hash(event) % len(self._shards)
+        return self._shards[index], self._locks[index]
+    
+    def subscribe(self, event: str, callback, batchable: bool = False, level: int = 0,
+                  max_hz: Optional[float] = None):
         """Suscribirse a un evento"""
-        if event not in self.observers:
-            self.observers[event] = []
-        self.observers[event].append(callback)
-        logger.debug(f"Observador suscrito a: {event}")
+        shard, lock = self._route(event)
+        with lock:
+            shard.subscribe(event, callback, batchable=batchable, level=level, max_hz=max_hz)
     
     def unsubscribe(self, event: str, callback):
         """Desuscribirse de un evento"""
-        if event in self.observers and callback in self.observers[event]:
-            self.observers[event].remove(callback)
-            logger.debug(f"Observador desuscrito de: {event}")
-    
-    def notify(self, event: str, data: Any = None):
-        """Notifica a todos los observadores"""
-        if event in self.observers:
-            for callback in self.observers[event]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    logger.error(f"Error notificando evento {event}: {e}")
+        shard, lock = self._route(event)
+        with lock:
+            shard.unsubscribe(event, callback)
+    
+    def notify(self, event: str, data: Any = None, level: int = 0):
+        """Notifica a los observadores suscritos con nivel <= level"""
+        if self.async_dispatch:
+            self._dispatcher.submit(event, data, level)
+        else:
+            self._deliver(event, data, level)
+    
+    def enqueue_notification(self, event: str, data: Any = None, level: int = 0):
+        """Encola la notificación para el hilo de fondo y retorna de inmediato"""
+        self._dispatcher.submit(event, data, level)
+    
+    def _deliver(self, event: str, data: Any = None, level: int = 0):
+        """Llama a los observadores en el hilo actual, fuera del candado"""
+        shard, lock = self._route(event)
+        with lock:
+            calls = shard._collect(event, data, level)
+        
+        log_error = logger.error
+        for callback, payload in calls:
+            try:
+                callback(payload)
+            except Exception as e:
+                log_error("Error notificando evento %s: %s", event, e)
+    
+    @contextmanager
+    def batch(self):
+        """Agrupa las notificaciones del bloque (del hilo actual) en todos los fragmentos"""
+        # El estado de batch() es por hilo: abrirlo no requiere candado
+        for shard in self._shards:
+            shard._enter_batch()
+        try:
+            yield self
+        finally:
+            calls = []
+            for shard, lock in zip(self._shards, self._locks):
+                with lock:
+                    calls.extend((shard, call) for call in shard._exit_batch())
+            for shard, (event, callback, datas) in calls:
+                shard._dispatch(event, callback, datas)
 
 
 # Instancia global
-notification_center = NotificationCenter()
+notification_center = ShardedNotificationCenter()
 
 
 # ==================== SCRIPT DE PRUEBA ====================
 
-if __name__ == "__main__":
+def _main(argv=None) -> int:
+    """
+    Prueba manual de las utilidades
+    
+    Sin opciones solo se ejecutan las pruebas rápidas (generación,
+    validaciones y conversiones); el diagnóstico y la búsqueda de discos,
+    que consultan el sistema y recorren directorios, van tras --diag y
+    --search.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Utilidades QEMU Manager")
+    parser.add_argument('--diag', action='store_true', help="diagnóstico y estadísticas del sistema")
+    parser.add_argument('--search', action='store_true', help="buscar imágenes de disco")
+    parser.add_argument('--generate', action='store_true', help="generar nombre, MAC y UUID")
+    parser.add_argument('--validate', action='store_true', help="validaciones y conversiones")
+    args = parser.parse_args(argv)
+    
+    if not (args.diag or args.search or args.generate or args.validate):
+        args.generate = args.validate = True
+    
     print("=== UTILIDADES QEMU MANAGER ===\n")
-    print("Ejecutando diagnóstico del sistema...\n")
-    
-    # Diagnóstico del sistema
-    diag = run_diagnostics()
-    
-    import pprint
-    print("\n--- Diagnóstico del Sistema ---")
-    pprint.pprint(diag)
-    
-    # Estadísticas del monitor
-    print("\n--- Estadísticas del Sistema ---")
-    stats = SystemMonitor.get_overall_stats()
-    pprint.pprint(stats)
-    
-    # Generación de nombres
-    print("\n--- Generación de Nombres ---")
-    print(f"Nombre único: {generate_unique_name('vm_test')}")
-    print(f"MAC Address: {generate_mac_address()}")
-    print(f"UUID: {generate_uuid()}")
-    
-    # Validaciones
-    print("\n--- Validaciones ---")
-    is_valid, msg = validate_vm_name("mi_vm_123")
-    print(f"VM 'mi_vm_123': {is_valid} - {msg}")
-    
-    is_valid, msg = validate_vm_name("vm inválido!")
-    print(f"VM 'vm inválido!': {is_valid} - {msg}")
-    
-    is_valid, msg = validate_ram(2048)
-    print(f"RAM 2048MB: {is_valid}")
-    
-    # Conversiones
-    print("\n--- Conversiones ---")
-    print(f"5368709120 bytes = {bytes_to_human_readable(5368709120)}")
-    print(f"3661 segundos = {seconds_to_human_readable(3661)}")
-    
-    # Búsqueda
-    print("\n--- Búsqueda de Imágenes ---")
-    disks = find_disk_images()
-    print(f"Discos encontrados: {len(disks)}")
-    for disk in disks[:3]:
-        print(f"  - {disk}")
-    
-    print("\n✓ Utilidades cargadas correctamente")
\ No newline at end of file
+    
+    if args.diag:
+        import pprint
+        print("Ejecutando diagnóstico del sistema...\n")
+        
+        # Diagnóstico del sistema
+        print("\n--- Diagnóstico del Sistema ---")
+        pprint.pprint(run_diagnostics())
+        
+        # Estadísticas del monitor
+        print("\n--- Estadísticas del Sistema ---")
+        pprint.pprint(SystemMonitor.get_overall_stats())
+    
+    if args.generate:
+        # Generación de nombres
+        print("\n--- Generación de Nombres ---")
+        print(f"Nombre único: {generate_unique_name('vm_test')}")
+        print(f"MAC Address: {generate_mac_address()}")
+        print(f"UUID: {generate_uuid()}")
+    
+    if args.validate:
+        # Validaciones
+        print("\n--- Validaciones ---")
+        is_valid, msg = validate_vm_name("mi_vm_123")
+        print(f"VM 'mi_vm_123': {is_valid} - {msg}")
+        
+        is_valid, msg = validate_vm_name("vm inválido!")
+        print(f"VM 'vm inválido!': {is_valid} - {msg}")
+        
+        is_valid, msg = validate_ram(2048)
+        print(f"RAM 2048MB: {is_valid}")
+        
+        # Conversiones
+        print("\n--- Conversiones ---")
+        print(f"5368709120 bytes = {bytes_to_human_readable(5368709120)}")
+        print(f"3661 segundos = {seconds_to_human_readable(3661)}")
+    
+    if args.search:
+        # Búsqueda
+        print("\n--- Búsqueda de Imágenes ---")
+        # Solo se muestran tres: el recorrido se detiene al encontrarlos
+        for disk in islice(find_disk_images_iter(), 3):
+            print(f"  - {disk}")
+    
+    print("\n✓ Utilidades cargadas correctamente")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())